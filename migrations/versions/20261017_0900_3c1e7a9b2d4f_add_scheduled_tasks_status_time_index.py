@@ -0,0 +1,26 @@
+"""Add composite (status, scheduled_at) index on scheduled_tasks
+
+Revision ID: 3c1e7a9b2d4f
+Revises: afdcfcbfd9ab
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1e7a9b2d4f'
+down_revision = 'afdcfcbfd9ab'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('scheduled_tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_scheduled_tasks_status_scheduled_at', ['status', 'scheduled_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('scheduled_tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_scheduled_tasks_status_scheduled_at')
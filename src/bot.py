@@ -7,6 +7,7 @@ Initializes the Slack app, registers event handlers, and starts Socket Mode.
 import os
 import sys
 import asyncio
+from pathlib import Path
 
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
@@ -15,6 +16,9 @@ from src.utils.logger import logger
 from src.utils.config_loader import config
 from src.utils.database import check_db_connection
 
+# Repository root (src/bot.py -> ..), so data paths don't depend on the working directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 # Initialize Slack app (ASYNC)
 app = AsyncApp(
@@ -57,30 +61,35 @@ def init_scheduler():
     from src.services.image_service import image_service
     from src.utils.database import get_db
 
-    # Initialize scheduler
-    setup_scheduler()
+    # Initialize scheduler paused so restored and newly registered jobs are
+    # processed in one pass once everything is in place
+    sched = setup_scheduler(paused=True)
     logger.info("APScheduler initialized")
 
-    # Schedule image posting if enabled and configured
-    image_interval_days = int(os.getenv("IMAGE_POST_INTERVAL_DAYS", "7"))
-    image_channel = os.getenv("IMAGE_POST_CHANNEL", "C12345678")  # Default to config
-
-    if image_service:
-        try:
-            async def post_scheduled_image(channel_id):
-                """Scheduled image posting function."""
-                await image_service.generate_and_post(channel_id=channel_id)
-
-            schedule_image_post_task(
-                interval_days=image_interval_days,
-                channel_id=image_channel,
-                post_image_func=post_scheduled_image
-            )
-            logger.info(f"Image posting scheduled (every {image_interval_days} days to {image_channel})")
-        except Exception as e:
-            logger.warning(f"Failed to schedule image posting: {e}")
-    else:
-        logger.warning("Image service not initialized - image posting disabled")
+    try:
+        # Schedule image posting if enabled and configured
+        image_interval_days = int(os.getenv("IMAGE_POST_INTERVAL_DAYS", "7"))
+        image_channel = os.getenv("IMAGE_POST_CHANNEL", "C12345678")  # Default to config
+
+        if image_service:
+            try:
+                async def post_scheduled_image(channel_id):
+                    """Scheduled image posting function."""
+                    await image_service.generate_and_post(channel_id=channel_id)
+
+                schedule_image_post_task(
+                    interval_days=image_interval_days,
+                    channel_id=image_channel,
+                    post_image_func=post_scheduled_image
+                )
+                logger.info(f"Image posting scheduled (every {image_interval_days} days to {image_channel})")
+            except Exception as e:
+                logger.warning(f"Failed to schedule image posting: {e}")
+        else:
+            logger.warning("Image service not initialized - image posting disabled")
+    finally:
+        # Always resume, even if registration failed, or every persisted job stays frozen
+        sched.resume()
 
 
 def seed_database():
@@ -150,10 +159,24 @@ def init_image_service():
         logger.error(f"Failed to initialize image service: {e}")
 
 
+def configure_tiktoken_cache():
+    """
+    Persist downloaded tiktoken BPE tables next to the database.
+
+    Fresh containers then don't fetch and parse them again on the first request.
+    tiktoken reads the variable when an encoding is first loaded, so this must
+    run before any LLM service is imported. An existing setting (e.g. from the
+    Docker image) takes precedence.
+    """
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(PROJECT_ROOT / "data" / "tiktoken"))
+
+
 async def main():
     """Main entry point for the bot application (async)."""
     logger.info("Starting Lukas the Bear chatbot...")
 
+    configure_tiktoken_cache()
+
     # Check database connection
     if not check_db_connection():
         logger.error("Failed to connect to database. Exiting.")
@@ -37,7 +37,7 @@ def get_llm_service():
                 logger.debug("Using MCP agent service with tools")
                 return llm_agent_service
         except Exception as e:
-            logger.debug(f"Agent service not available: {e}")
+            logger.debug("Agent service not available: %s", e)
 
     logger.debug("Using standard LLM service")
     return llm_service
@@ -111,10 +111,10 @@ async def handle_direct_message(event: dict, say, client, logger_inst=logger):
                 token_count=token_count,
             )
 
-            # Get conversation history
+            # Get conversation history (only as much as the service can use)
             recent_messages = conv_repo.get_recent_messages(
                 conversation_id=conversation.id,
-                limit=service.max_context_messages * 2,
+                limit=service.history_limit,
             )
 
             # Send placeholder "thinking" message for immediate feedback
@@ -134,6 +134,7 @@ async def handle_direct_message(event: dict, say, client, logger_inst=logger):
                     user_message=text,
                     user_id=user_id,
                     user_name=display_name,
+                    conversation_id=conversation.id,
                 )
             else:
                 response_text = service.generate_response(
@@ -164,6 +165,9 @@ async def handle_direct_message(event: dict, say, client, logger_inst=logger):
                     result = await say(text=response_text, channel=channel)
                     response_ts = result.get("ts")
 
+                # Update engagement metrics; committed together with the bot response
+                team_member_repo.increment_message_count(team_member.id, commit=False)
+
                 # Store bot response
                 response_token_count = service.estimate_tokens(response_text) if hasattr(service, 'estimate_tokens') else llm_service.estimate_message_tokens(response_text)
                 conv_repo.add_message(
@@ -180,9 +184,6 @@ async def handle_direct_message(event: dict, say, client, logger_inst=logger):
                 logger_inst.error(f"Error posting message to Slack: {e}")
                 raise
 
-            # Update engagement metrics
-            team_member_repo.increment_message_count(team_member.id)
-
     except Exception as e:
         logger_inst.error(f"Error handling direct message: {e}", exc_info=True)
         # Try to send error message to user
@@ -262,10 +263,10 @@ async def handle_app_mention(event: dict, say, client, logger_inst=logger):
                 token_count=token_count,
             )
 
-            # Get conversation history
+            # Get conversation history (only as much as the service can use)
             recent_messages = conv_repo.get_recent_messages(
                 conversation_id=conversation.id,
-                limit=service.max_context_messages * 2,
+                limit=service.history_limit,
             )
 
             # Send placeholder "thinking" message for immediate feedback
@@ -285,6 +286,7 @@ async def handle_app_mention(event: dict, say, client, logger_inst=logger):
                     user_message=text,
                     user_id=user_id,
                     user_name=display_name,
+                    conversation_id=conversation.id,
                 )
             else:
                 response_text = service.generate_response(
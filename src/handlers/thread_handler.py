@@ -22,6 +22,7 @@ from src.models.message import Message
 from src.handlers.message_handler import get_llm_service
 from src.utils.logger import logger
 from src.utils.config_loader import config
+from src.utils.database import get_db
 
 
 class ThreadHandler:
@@ -81,7 +82,7 @@ class ThreadHandler:
 
             # Empty list means monitor ALL channels
             if not monitored_channels:
-                logger.debug(f"No monitored_channels configured, monitoring all channels")
+                logger.debug("No monitored_channels configured, monitoring all channels")
                 return True
 
             # Check if channel ID is in the list
@@ -98,7 +99,7 @@ class ThreadHandler:
 
                 # Check if channel name is in monitored list
                 if channel_name in monitored_channels:
-                    logger.debug(f"Channel {channel_name} ({channel_id}) is monitored")
+                    logger.debug("Channel %s (%s) is monitored", channel_name, channel_id)
                     return True
 
                 logger.info(f"🚫 Channel {channel_name} ({channel_id}) not in monitored list, skipping")
@@ -196,7 +197,7 @@ class ThreadHandler:
             context_parts.append(f"<{user}>: {text}")
 
         context = "\n".join(context_parts)
-        logger.debug(f"Extracted thread context: {len(context)} chars from {len(recent_messages)} messages")
+        logger.debug("Extracted thread context: %s chars from %s messages", len(context), len(recent_messages))
         return context
 
     async def handle_thread_message(
@@ -530,7 +531,7 @@ Consider Lukas the Bear's friendly, supportive personality when choosing."""
 
             # Validate it's in our available list
             if emoji in available_emojis:
-                logger.debug(f"LLM selected emoji: {emoji}")
+                logger.debug("LLM selected emoji: %s", emoji)
                 return emoji
             else:
                 logger.warning(f"LLM selected invalid emoji '{emoji}', using 'bear' as fallback")
@@ -602,12 +603,12 @@ Consider Lukas the Bear's friendly, supportive personality when choosing."""
 
                 # Don't respond to bot messages
                 if event.get("bot_id"):
-                    logger.debug(f"Skipping bot message")
+                    logger.debug("Skipping bot message")
                     return
 
                 # Skip DMs (handled by message_handler)
                 if event.get("channel_type") == "im":
-                    logger.debug(f"Skipping DM (handled by message_handler)")
+                    logger.debug("Skipping DM (handled by message_handler)")
                     return
 
                 channel_id = event.get("channel")
@@ -617,7 +618,6 @@ Consider Lukas the Bear's friendly, supportive personality when choosing."""
                 thread_ts = event.get("thread_ts")
 
                 # Create fresh DB session for this handler execution
-                from src.utils.database import get_db
                 with get_db() as db:
                     # Update instance db session for this execution
                     original_db = self.db
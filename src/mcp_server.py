@@ -42,7 +42,9 @@ def get_service() -> CommandService:
     if _command_service is None:
         logger.info("Initializing CommandService for MCP server...")
         _db_session = get_db_session()
-        _slack_client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"))
+        # One client for the whole process so tool calls share its HTTPS
+        # connection; bounded timeout so a stalled Slack call can't hang a tool
+        _slack_client = WebClient(token=os.getenv("SLACK_BOT_TOKEN"), timeout=10)
 
         # Initialize ImageService for this process
         # The MCP server runs as a separate process, so it needs its own ImageService instance
@@ -5,7 +5,7 @@ All database models inherit from the Base declarative base.
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy.orm import DeclarativeBase
 
@@ -21,8 +21,8 @@ def generate_uuid() -> str:
 
 
 def utc_now() -> datetime:
-    """Get current UTC datetime."""
-    return datetime.utcnow()
+    """Get current UTC datetime (naive, matching the DateTime columns)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 # Import all models
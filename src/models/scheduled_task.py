@@ -8,7 +8,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, Integer, String, Text, JSON
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models import Base, generate_uuid, utc_now
@@ -50,6 +50,10 @@ class ScheduledTask(Base):
     """
 
     __tablename__ = "scheduled_tasks"
+    __table_args__ = (
+        # Pending/upcoming lookups filter on status and order by scheduled_at
+        Index("ix_scheduled_tasks_status_scheduled_at", "status", "scheduled_at"),
+    )
 
     # Primary key
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
@@ -4,12 +4,13 @@ Conversation repository.
 Data access layer for ConversationSession and Message entities.
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import List, Optional
 
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, delete, desc, lambda_stmt, select
 from sqlalchemy.orm import Session, joinedload
 
+from src.models import utc_now
 from src.models.conversation import ConversationSession
 from src.models.message import Message
 from src.utils.logger import logger
@@ -151,13 +152,13 @@ class ConversationRepository:
         # Update conversation metadata
         conversation = self.db.query(ConversationSession).get(conversation_id)
         if conversation:
-            conversation.last_message_at = datetime.utcnow()
+            conversation.last_message_at = utc_now()
             conversation.message_count += 1
             conversation.total_tokens += token_count
 
         self.db.commit()
         self.db.refresh(message)
-        logger.debug(f"Added message {message.id} to conversation {conversation_id}")
+        logger.debug("Added message %s to conversation %s", message.id, conversation_id)
         return message
 
     def get_recent_messages(
@@ -175,13 +176,15 @@ class ConversationRepository:
         Returns:
             List of Message objects (ordered oldest to newest)
         """
-        messages = (
-            self.db.query(Message)
-            .filter(Message.conversation_id == conversation_id)
+        # Runs for every message Lukas answers; lambda_stmt caches the
+        # statement construction, not just the compiled SQL
+        stmt = lambda_stmt(
+            lambda: select(Message)
+            .where(Message.conversation_id == conversation_id)
             .order_by(desc(Message.timestamp))
             .limit(limit)
-            .all()
         )
+        messages = self.db.scalars(stmt).all()
         # Reverse to get oldest to newest
         return list(reversed(messages))
 
@@ -195,7 +198,7 @@ class ConversationRepository:
         Returns:
             Number of conversations deactivated
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_time = utc_now() - timedelta(hours=hours)
         result = (
             self.db.query(ConversationSession)
             .filter(
@@ -220,15 +223,23 @@ class ConversationRepository:
         Returns:
             Number of conversations deleted
         """
-        cutoff_time = datetime.utcnow() - timedelta(days=days)
-        conversations = (
-            self.db.query(ConversationSession)
-            .filter(ConversationSession.created_at < cutoff_time)
-            .all()
+        cutoff_time = utc_now() - timedelta(days=days)
+        old_conversations = ConversationSession.created_at < cutoff_time
+
+        # Two set-based DELETEs instead of loading and deleting every conversation
+        # (and lazy-loading its messages for the ORM cascade) row by row.
+        # Messages go first since the foreign key has no ON DELETE CASCADE.
+        self.db.execute(
+            delete(Message).where(
+                Message.conversation_id.in_(select(ConversationSession.id).where(old_conversations))
+            ),
+            execution_options={"synchronize_session": "fetch"},
+        )
+        result = self.db.execute(
+            delete(ConversationSession).where(old_conversations),
+            execution_options={"synchronize_session": "fetch"},
         )
-        count = len(conversations)
-        for conv in conversations:
-            self.db.delete(conv)
+        count = result.rowcount
         self.db.commit()
         logger.info(f"Deleted {count} conversations older than {days} days")
         return count
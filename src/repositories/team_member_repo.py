@@ -4,12 +4,13 @@ Team member repository.
 Data access layer for TeamMember entity.
 """
 
-from datetime import datetime
+from datetime import timedelta
 from typing import List, Optional
 
-from sqlalchemy import and_
+from sqlalchemy import and_, lambda_stmt, select
 from sqlalchemy.orm import Session
 
+from src.models import utc_now
 from src.models.team_member import TeamMember
 from src.utils.logger import logger
 from src.utils.config_loader import config
@@ -31,11 +32,12 @@ class TeamMemberRepository:
         Returns:
             TeamMember or None
         """
-        return (
-            self.db.query(TeamMember)
-            .filter(TeamMember.slack_user_id == slack_user_id)
-            .first()
+        # Looked up for every incoming message; lambda_stmt caches the
+        # statement construction, not just the compiled SQL
+        stmt = lambda_stmt(
+            lambda: select(TeamMember).where(TeamMember.slack_user_id == slack_user_id)
         )
+        return self.db.scalars(stmt).first()
 
     def get_or_create(
         self,
@@ -80,7 +82,7 @@ class TeamMemberRepository:
                 logger.info(f"Updated admin status for {slack_user_id} to {is_admin}")
 
             if updated:
-                member.updated_at = datetime.utcnow()
+                member.updated_at = utc_now()
                 self.db.commit()
                 self.db.refresh(member)
             return member
@@ -111,21 +113,24 @@ class TeamMemberRepository:
         """
         member = self.db.query(TeamMember).get(member_id)
         if member:
-            member.last_proactive_dm_at = datetime.utcnow()
+            member.last_proactive_dm_at = utc_now()
             self.db.commit()
-            logger.debug(f"Updated last_proactive_dm_at for member {member_id}")
+            logger.debug("Updated last_proactive_dm_at for member %s", member_id)
 
-    def increment_message_count(self, member_id: str) -> None:
+    def increment_message_count(self, member_id: str, commit: bool = True) -> None:
         """
         Increment the total message count for a team member.
 
         Args:
             member_id: Team member ID
+            commit: Commit immediately; pass False to include the change in
+                the caller's next commit
         """
         member = self.db.query(TeamMember).get(member_id)
         if member:
             member.total_messages_sent += 1
-            self.db.commit()
+            if commit:
+                self.db.commit()
 
     def get_active_non_bot_members(self) -> List[TeamMember]:
         """
@@ -157,9 +162,8 @@ class TeamMemberRepository:
         Returns:
             List of TeamMember objects
         """
-        from datetime import timedelta
 
-        cutoff_time = datetime.utcnow() - timedelta(hours=exclude_recent_hours)
+        cutoff_time = utc_now() - timedelta(hours=exclude_recent_hours)
 
         return (
             self.db.query(TeamMember)
@@ -10,7 +10,6 @@ Returns structured dictionaries instead of formatted strings for flexibility.
 
 import re
 import os
-import json
 import uuid
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -30,6 +29,14 @@ from src.utils.logger import logger
 from src.utils.database import get_db
 
 
+# Patterns for parsing command arguments, compiled once
+_DURATION_PATTERN = re.compile(r"^(\d+)\s*(minute|minutes|min|mins|hour|hours|hr|hrs)$")
+_HOURS_PATTERN = re.compile(r"^(\d+)\s*(?:hour|hours|hr|hrs)$")
+_DAYS_PATTERN = re.compile(r"^(\d+)\s*(?:day|days)$")
+_TIME_12H_PATTERN = re.compile(r"^(\d{1,2})(?::(\d{1,2}))?(am|pm)$")  # 3pm, 2:30pm
+_TIME_24H_PATTERN = re.compile(r"^(\d{1,2}):(\d{1,2})$")  # 14:30
+
+
 class PermissionDeniedError(Exception):
     """Raised when a user lacks permission to execute a command."""
 
@@ -209,33 +216,46 @@ class CommandService:
                     "message": f"I couldn't understand the time '{when}'. Try '30 minutes', '2 hours', or '3pm'."
                 }
 
-            # Create scheduled task in database
+            # Create scheduled task in database. Both ids are generated client-side
+            # so a single INSERT stores the record with its APScheduler job id.
+            task_id = str(uuid.uuid4())
             task_record = ScheduledTask(
-                id=str(uuid.uuid4()),
-                job_id=f"reminder_{user.id}_{int(datetime.now().timestamp())}",
+                id=task_id,
+                job_id=f"reminder_{task_id}",
                 task_type="reminder",
                 target_type="user",
                 target_id=user.slack_user_id,
                 scheduled_at=scheduled_at,
                 status="pending",
-                metadata=json.dumps({
+                # JSON column: serialized once on flush, decoded once on load
+                meta={
                     "message": task,
                     "requested_by": user.display_name
-                }),
+                },
             )
 
+            # Commit the record before storing the job: the job store writes to
+            # the same SQLite file, so an open write transaction here would block
+            # its INSERT until the busy timeout expires
             self.db.add(task_record)
             self.db.commit()
 
-            # Schedule the job with APScheduler
-            scheduler.add_job(
-                func=self._send_reminder,
-                trigger="date",
-                run_date=scheduled_at,
-                args=[user.slack_user_id, task, task_record.id],
-                id=task_record.job_id,
-                replace_existing=True,
-            )
+            try:
+                scheduler.add_job(
+                    func=self._send_reminder,
+                    trigger="date",
+                    run_date=scheduled_at,
+                    args=[user.slack_user_id, task, task_record.id],
+                    id=task_record.job_id,
+                    executor="io",
+                    replace_existing=True,
+                )
+            except Exception as e:
+                # No job will ever run this reminder; don't leave it pending
+                task_record.status = "failed"
+                task_record.error_message = f"Failed to schedule job: {e}"
+                self.db.commit()
+                raise
 
             logger.info(f"Scheduled reminder for {user.display_name} at {scheduled_at}: {task}")
 
@@ -249,6 +269,7 @@ class CommandService:
 
         except Exception as e:
             logger.error(f"Error creating reminder: {e}")
+            self.db.rollback()
             return {
                 "success": False,
                 "scheduled_at": None,
@@ -598,7 +619,7 @@ class CommandService:
         """Parse duration string to minutes (e.g., '30 minutes', '2 hours')."""
         duration = duration.lower().strip()
 
-        match = re.match(r"^(\d+)\s*(minute|minutes|min|mins|hour|hours|hr|hrs)$", duration)
+        match = _DURATION_PATTERN.match(duration)
         if not match:
             return None
 
@@ -615,41 +636,40 @@ class CommandService:
     def _parse_time_to_datetime(self, time_str: str) -> Optional[datetime]:
         """Parse time string to datetime (today)."""
         time_str = time_str.lower().strip()
-        now = datetime.now()
-
-        # Try different formats
-        formats = [
-            "%I%p",      # 3pm
-            "%I:%M%p",   # 2:30pm
-            "%H:%M",     # 14:30
-        ]
 
-        for fmt in formats:
-            try:
-                parsed_time = datetime.strptime(time_str, fmt)
-                # Combine with today's date
-                scheduled = now.replace(
-                    hour=parsed_time.hour,
-                    minute=parsed_time.minute,
-                    second=0,
-                    microsecond=0,
-                )
+        # Match the supported formats directly instead of trying strptime per format
+        match = _TIME_12H_PATTERN.match(time_str)
+        if match:
+            hour = int(match.group(1))
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if match.group(3) == "pm" else 0)
+        else:
+            match = _TIME_24H_PATTERN.match(time_str)
+            if not match:
+                return None
+            hour = int(match.group(1))
+            if hour > 23:
+                return None
+        minute = int(match.group(2) or 0)
+        if minute > 59:
+            return None
 
-                # If time has passed today, schedule for tomorrow
-                if scheduled < now:
-                    scheduled += timedelta(days=1)
+        # Combine with today's date
+        now = datetime.now()
+        scheduled = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
-                return scheduled
-            except ValueError:
-                continue
+        # If time has passed today, schedule for tomorrow
+        if scheduled < now:
+            scheduled += timedelta(days=1)
 
-        return None
+        return scheduled
 
     def _parse_hours_from_string(self, value: str) -> Optional[int]:
         """Parse hours from string like '24 hours' or '12 hrs'."""
         value = value.lower().strip()
 
-        match = re.match(r"^(\d+)\s*(?:hour|hours|hr|hrs)$", value)
+        match = _HOURS_PATTERN.match(value)
         if match:
             return int(match.group(1))
 
@@ -663,7 +683,7 @@ class CommandService:
         """Parse days from string like '7 days' or '14 day'."""
         value = value.lower().strip()
 
-        match = re.match(r"^(\d+)\s*(?:day|days)$", value)
+        match = _DAYS_PATTERN.match(value)
         if match:
             return int(match.group(1))
 
@@ -673,38 +693,40 @@ class CommandService:
         except ValueError:
             return None
 
-    async def _send_reminder(self, user_id: str, message: str, task_id: str):
+    @staticmethod
+    async def _send_reminder(user_id: str, message: str, task_id: str):
         """
         Send a reminder message to a user.
 
-        Called by APScheduler when reminder time arrives.
+        Called by APScheduler when reminder time arrives. Static so the
+        persistent job store can pickle a reference to it.
         """
-        try:
-            # Import bot app to access client
-            from src.bot import app
+        # One session serves both the success and failure bookkeeping
+        with get_db() as db:
+            task = db.query(ScheduledTask).filter_by(id=task_id).first()
+            try:
+                # Import bot app to access client
+                from src.bot import app
 
-            # Send DM to user
-            await app.client.chat_postMessage(
-                channel=user_id,
-                text=f"⏰ **Reminder:** {message}\n\n🐻 Hope this helps!",
-            )
+                # Send DM to user
+                await app.client.chat_postMessage(
+                    channel=user_id,
+                    text=f"⏰ **Reminder:** {message}\n\n🐻 Hope this helps!",
+                )
 
-            # Update task status
-            with get_db() as db:
-                task = db.query(ScheduledTask).filter_by(id=task_id).first()
+                # Update task status
                 if task:
                     task.status = "completed"
                     task.executed_at = datetime.now()
                     db.commit()
 
-            logger.info(f"Sent reminder to {user_id}: {message}")
+                logger.info(f"Sent reminder to {user_id}: {message}")
 
-        except Exception as e:
-            logger.error(f"Error sending reminder: {e}")
+            except Exception as e:
+                logger.error(f"Error sending reminder: {e}")
 
-            # Update task status to failed
-            with get_db() as db:
-                task = db.query(ScheduledTask).filter_by(id=task_id).first()
+                # Update task status to failed
+                db.rollback()
                 if task:
                     task.status = "failed"
                     task.error_message = str(e)
@@ -717,9 +739,15 @@ class CommandService:
         Returns:
             (data_dict, formatted_string)
         """
-        # Query active team members
+        # Query active team members; only the listed columns are needed, so
+        # load plain rows instead of full ORM entities
         members = (
-            self.db.query(TeamMember)
+            self.db.query(
+                TeamMember.slack_user_id,
+                TeamMember.display_name,
+                TeamMember.is_admin,
+                TeamMember.total_messages_sent,
+            )
             .filter_by(is_active=True, is_bot=False)
             .order_by(TeamMember.display_name)
             .all()
@@ -5,16 +5,43 @@ Manages proactive team engagement including random DM selection and thread engag
 Implements probability-based engagement logic with fair distribution and active hours checking.
 """
 
+import logging
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional, List, Dict, Any
+from zoneinfo import ZoneInfo
+
 from sqlalchemy.orm import Session
 
 from src.models.team_member import TeamMember
 from src.repositories.team_member_repo import TeamMemberRepository
 from src.repositories.config_repo import ConfigurationRepository
+from src.utils.config_loader import config
 from src.utils.logger import logger
 
+# Sort key for fair DM distribution (least recently contacted first)
+_BY_LAST_DM = attrgetter("last_proactive_dm_at")
+
+
+@lru_cache(maxsize=16)
+def _resolve_timezone(timezone: str) -> ZoneInfo:
+    """
+    Resolve a configured timezone name to a tzinfo, once per name.
+
+    Args:
+        timezone: Timezone string (e.g., 'Europe/Berlin', 'Germany/Berlin')
+
+    Returns:
+        ZoneInfo for the timezone
+
+    Raises:
+        Exception: If the timezone name is unknown (not cached, so retried next call)
+    """
+    # Handle common timezone name variations
+    return ZoneInfo(timezone.replace("Germany/", "Europe/"))
+
 
 class EngagementService:
     """
@@ -66,8 +93,8 @@ class EngagementService:
 
         engaged = random_value < probability
         logger.debug(
-            f"Engagement decision: probability={probability:.2f}, "
-            f"random={random_value:.2f}, engaged={engaged}"
+            "Engagement decision: probability=%.2f, random=%.2f, engaged=%s",
+            probability, random_value, engaged,
         )
         return engaged
 
@@ -95,18 +122,17 @@ class EngagementService:
             return True
 
         if check_time is None:
-            from datetime import timezone as dt_timezone
             check_time = datetime.now(dt_timezone.utc)
 
         # Convert to configured timezone if provided
         if timezone:
             try:
-                from zoneinfo import ZoneInfo
-                # Handle common timezone name variations
-                tz_name = timezone.replace("Germany/", "Europe/")
-                tz = ZoneInfo(tz_name)
+                tz = _resolve_timezone(timezone)
                 check_time = check_time.astimezone(tz)
-                logger.debug(f"Converted to timezone {tz_name}: {check_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Converted to timezone %s: %s", tz.key, check_time.strftime("%Y-%m-%d %H:%M:%S %Z")
+                    )
             except Exception as e:
                 logger.warning(f"Invalid timezone '{timezone}': {e}, using server time")
 
@@ -115,8 +141,8 @@ class EngagementService:
 
         if not within_hours:
             logger.debug(
-                f"Outside active hours: current={current_hour}, "
-                f"allowed={start_hour}-{end_hour}"
+                "Outside active hours: current=%s, allowed=%s-%s",
+                current_hour, start_hour, end_hour,
             )
 
         return within_hours
@@ -154,8 +180,7 @@ class EngagementService:
             return selected
 
         # Otherwise select user contacted longest ago
-        previously_contacted.sort(key=lambda u: u.last_proactive_dm_at)
-        selected = previously_contacted[0]
+        selected = min(previously_contacted, key=_BY_LAST_DM)
 
         hours_since = (datetime.now() - selected.last_proactive_dm_at).total_seconds() / 3600
         logger.info(
@@ -164,15 +189,43 @@ class EngagementService:
         )
         return selected
 
+    def select_dm_recipients(self, count: int) -> List[TeamMember]:
+        """
+        Select several distinct team members for proactive DMs at once.
+
+        Uses the same priority as select_dm_recipient: never-contacted users
+        (in random order) first, then those contacted longest ago.
+
+        Args:
+            count: Maximum number of recipients to select
+
+        Returns:
+            Up to count TeamMembers, highest priority first
+        """
+        eligible_users = self.team_member_repo.get_active_non_bot_members()
+
+        never_contacted = [u for u in eligible_users if u.last_proactive_dm_at is None]
+        random.shuffle(never_contacted)
+        previously_contacted = sorted(
+            (u for u in eligible_users if u.last_proactive_dm_at is not None),
+            key=_BY_LAST_DM,
+        )
+
+        selected = (never_contacted + previously_contacted)[:count]
+        logger.info(f"Selected {len(selected)} of {len(eligible_users)} eligible users for DMs")
+        return selected
+
     def update_last_proactive_dm(self, team_member: TeamMember) -> None:
         """
         Update last_proactive_dm_at timestamp for a team member.
 
+        Does not commit, so the caller can persist it together with the
+        rest of the DM bookkeeping in one transaction.
+
         Args:
             team_member: Team member who received proactive DM
         """
         team_member.last_proactive_dm_at = datetime.now()
-        self.db.commit()
         logger.info(
             f"Updated last_proactive_dm_at for {team_member.display_name}"
         )
@@ -186,10 +239,9 @@ class EngagementService:
         """
         try:
             # Read from YAML config file instead of database
-            from src.utils.config_loader import config
             probability = config.get("bot", {}).get("engagement", {}).get("thread_response_probability", 0.20)
             prob_float = float(probability)
-            logger.debug(f"Using engagement probability from config: {prob_float:.0%}")
+            logger.debug("Using engagement probability from config: %.0f%%", prob_float * 100)
             return prob_float
         except Exception as e:
             logger.error(f"Error getting engagement probability: {e}, using default 0.20")
@@ -207,10 +259,9 @@ class EngagementService:
         """
         try:
             # Read from YAML config file
-            from src.utils.config_loader import config
             probability = config.get("bot", {}).get("engagement", {}).get("reaction_probability", 0.30)
             prob_float = float(probability)
-            logger.debug(f"Using reaction probability from config: {prob_float:.0%}")
+            logger.debug("Using reaction probability from config: %.0f%%", prob_float * 100)
             return prob_float
         except Exception as e:
             logger.error(f"Error getting reaction probability: {e}, using default 0.30")
@@ -225,7 +276,6 @@ class EngagementService:
         """
         try:
             # Read from YAML config file instead of database
-            from src.utils.config_loader import config
             active_hours_config = config.get("bot", {}).get("engagement", {}).get("active_hours", {})
 
             if active_hours_config and isinstance(active_hours_config, dict):
@@ -237,7 +287,7 @@ class EngagementService:
                 if start_str and end_str:
                     start = int(start_str.split(":")[0])
                     end = int(end_str.split(":")[0])
-                    logger.debug(f"Using active hours from config: {start}:00-{end}:00 ({timezone_str})")
+                    logger.debug("Using active hours from config: %s:00-%s:00 (%s)", start, end, timezone_str)
                     return (start, end, timezone_str)
 
             logger.debug("No active hours restriction configured (24/7 mode)")
@@ -268,10 +318,9 @@ class EngagementService:
         # Read threshold from config if not provided
         if threshold is None:
             try:
-                from src.utils.config_loader import config
                 threshold = config.get("bot", {}).get("engagement", {}).get("thread_activity_threshold", 10)
                 threshold = int(threshold)
-                logger.debug(f"Using thread activity threshold from config: {threshold}")
+                logger.debug("Using thread activity threshold from config: %s", threshold)
             except Exception as e:
                 logger.error(f"Error getting thread activity threshold: {e}, using default 10")
                 threshold = 10
@@ -280,8 +329,8 @@ class EngagementService:
 
         if is_too_active:
             logger.debug(
-                f"Thread too active: {message_count} messages in {time_window_minutes}min "
-                f"(threshold={threshold})"
+                "Thread too active: %s messages in %smin (threshold=%s)",
+                message_count, time_window_minutes, threshold,
             )
 
         return is_too_active
@@ -295,10 +344,9 @@ class EngagementService:
         """
         try:
             # Read from YAML config file instead of database
-            from src.utils.config_loader import config
             interval = config.get("bot", {}).get("engagement", {}).get("random_dm_interval_hours", 24)
             interval_float = float(interval)
-            logger.debug(f"Using random DM interval from config: {interval_float} hours")
+            logger.debug("Using random DM interval from config: %s hours", interval_float)
             return interval_float
         except Exception as e:
             logger.error(f"Error getting DM interval: {e}, using default 24 hours")
@@ -327,11 +375,11 @@ class EngagementService:
 
         if should_send:
             logger.debug(
-                f"Random DM interval passed: {time_since_last:.1f}h >= {interval_hours}h"
+                "Random DM interval passed: %.1fh >= %sh", time_since_last, interval_hours
             )
         else:
             logger.debug(
-                f"Random DM interval not passed: {time_since_last:.1f}h < {interval_hours}h"
+                "Random DM interval not passed: %.1fh < %sh", time_since_last, interval_hours
             )
 
         return should_send
@@ -351,7 +399,9 @@ class EngagementService:
         """
         reaction_prob = self.get_reaction_probability()
         should_react = self.should_engage(reaction_prob, random_value)
-        logger.debug(f"Reaction decision: probability={reaction_prob:.0%}, should_react={should_react}")
+        logger.debug(
+            "Reaction decision: probability=%.0f%%, should_react=%s", reaction_prob * 100, should_react
+        )
         return should_react
 
     def should_respond_with_text(self, random_value: Optional[float] = None) -> bool:
@@ -369,7 +419,9 @@ class EngagementService:
         """
         text_prob = self.get_engagement_probability()
         should_respond = self.should_engage(text_prob, random_value)
-        logger.debug(f"Text response decision: probability={text_prob:.0%}, should_respond={should_respond}")
+        logger.debug(
+            "Text response decision: probability=%.0f%%, should_respond=%s", text_prob * 100, should_respond
+        )
         return should_respond
 
     def get_available_emojis(self) -> list[str]:
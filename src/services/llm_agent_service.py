@@ -5,26 +5,60 @@ Uses the official MCP SDK with SSE transport to connect to MCP servers
 running in Docker containers. Integrates with LangChain for agent capabilities.
 """
 
-import os
 import asyncio
-from typing import List, Dict, Any, Optional
+import logging
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 import httpx
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.tools import StructuredTool
+from langchain_openai import ChatOpenAI
+from langgraph.prebuilt import create_react_agent
 from mcp import ClientSession
 from mcp.client.sse import sse_client
-from pybreaker import CircuitBreaker
+from pybreaker import STATE_OPEN, CircuitBreaker, CircuitBreakerError, CircuitBreakerListener
 from pydantic import BaseModel, Field, create_model
 
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_core.tools import StructuredTool
-from langgraph.prebuilt import create_react_agent
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 from src.models.message import Message
 from src.services.persona_service import persona_service
 from src.utils.logger import logger
 from src.utils.retry import retry_on_api_error
+from src.utils.tokens import TOKENS_PER_MESSAGE, history_token_budget
+
+# Extracts .text from MCP content items
+_get_text = attrgetter('text')
+
+# Conversations whose rolling summary is kept in memory (least recently used evicted)
+_MAX_CACHED_SUMMARIES = 256
+
+
+class _MessageSnapshot(NamedTuple):
+    """Message fields needed for summarizing, detached from the ORM session."""
+
+    id: str
+    sender_type: str
+    content: str
+
+
+class _BreakerOpenTimes(CircuitBreakerListener):
+    """Record when each circuit breaker last opened (pybreaker keeps this private)."""
+
+    def __init__(self):
+        self.opened_at: Dict[CircuitBreaker, datetime] = {}
+
+    def state_change(self, cb, old_state, new_state) -> None:
+        if new_state.name == STATE_OPEN:
+            self.opened_at[cb] = datetime.now(timezone.utc)
 
 
 class LLMAgentService:
@@ -44,8 +78,9 @@ class LLMAgentService:
         self,
         model: Optional[str] = None,
         max_context_messages: int = 10,
-        max_tokens_per_request: int = 8000,
+        max_tokens_per_request: int = 16000,  # Leaves ~8000 for history after the response
         max_response_tokens: int = 8000,  # Increased for reasoning models
+        summary_model: Optional[str] = None,
     ):
         """
         Initialize LLM agent service.
@@ -53,13 +88,24 @@ class LLMAgentService:
         Args:
             model: LLM model name (defaults to env LLM_MODEL or gpt-4o-mini)
             max_context_messages: Maximum message pairs in context
-            max_tokens_per_request: Maximum tokens per request
+            max_tokens_per_request: Maximum tokens per request (prompt and response)
             max_response_tokens: Maximum tokens in response
+            summary_model: Model used to summarize evicted history
+                (defaults to env LLM_SUMMARY_MODEL or gpt-4o-mini)
         """
         self.model = model or os.getenv("LLM_MODEL", "gpt-4o-mini")
+        self.summary_model = summary_model or os.getenv("LLM_SUMMARY_MODEL", "gpt-4o-mini")
         self.max_context_messages = max_context_messages
         self.max_tokens_per_request = max_tokens_per_request
         self.max_response_tokens = max_response_tokens
+        # Messages callers should load per request: the sliding window plus
+        # older turns that get folded into the conversation summary
+        self.history_limit = max_context_messages * 4
+        # Budget for context content, with the response and per-message overhead
+        # of a full sliding window reserved up front (same as LLMService)
+        self._history_budget = history_token_budget(
+            max_tokens_per_request, max_response_tokens, max_context_messages * 2
+        )
 
         # Initialize OpenAI LLM
         api_key = os.getenv("OPENAI_API_KEY")
@@ -74,21 +120,107 @@ class LLMAgentService:
             api_key=api_key
         )
 
+        # Smaller/faster LLM for rolling conversation summaries
+        self.summary_llm = ChatOpenAI(
+            model=self.summary_model,
+            temperature=0,
+            max_tokens=300,
+            api_key=api_key
+        )
+
+        # Persona system message, resolved lazily (see _system_message)
+        self._system_message_cache: Optional[SystemMessage] = None
+
+        # Tokenizer for context budgeting (None -> ~4 chars per token estimate)
+        self._encoding = self._load_encoding()
+
+        # Rolling summaries of history evicted from the sliding window, as an LRU:
+        # conversation_id -> (summary text, id of last summarized message)
+        self._conversation_summaries: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._summary_tasks: Dict[str, asyncio.Task] = {}  # conversation_id -> in-flight update
+
         # MCP connection management (support multiple servers)
         self.mcp_sessions: Dict[str, ClientSession] = {}  # server_name -> session
         self.mcp_tools: List[StructuredTool] = []
+        # Bulkhead: cap concurrent tool calls per MCP server
+        self.mcp_max_concurrent_calls = int(os.getenv("MCP_BULKHEAD", "8"))
+        self._server_semaphores: Dict[str, asyncio.Semaphore] = {}  # server_name -> semaphore
         self.agent = None  # LangGraph agent
+        self._agent_tools_fingerprint: Optional[Tuple[str, ...]] = None  # Tool names the agent was built with
+        self._mcp_supervisor: Optional[asyncio.Task] = None  # Owns the MCP TaskGroup
         self._mcp_tasks: List[asyncio.Task] = []  # Background tasks for MCP lifecycle
         self._mcp_ready_events: List[asyncio.Event] = []  # Signals when each MCP is ready
 
-        # Circuit breaker for MCP connections
-        self.circuit_breaker = CircuitBreaker(
-            fail_max=5,
-            reset_timeout=60,
-        )
+        # Circuit breakers for MCP tool calls (one per server)
+        self._breakers: Dict[str, CircuitBreaker] = {}  # server_name -> breaker
+        self._breaker_listener = _BreakerOpenTimes()
 
         logger.info(f"LLM Agent service initialized with model {self.model}")
 
+    def _system_message(self) -> SystemMessage:
+        """
+        Get the persona system message, building it once per instance.
+
+        Returns:
+            SystemMessage with Lukas' persona prompt
+        """
+        if self._system_message_cache is None:
+            self._system_message_cache = SystemMessage(content=persona_service.get_system_prompt())
+        return self._system_message_cache
+
+    def refresh_persona(self) -> None:
+        """Drop the cached persona prompt and rebuild the agent with the new one."""
+        self._system_message_cache = None
+        if self.agent is not None:
+            self._agent_tools_fingerprint = None
+            self._create_agent()
+
+    def _tools_available(self) -> bool:
+        """
+        Check whether an agent call with tools is worth attempting.
+
+        Returns:
+            False if no agent exists or any MCP server's circuit is open
+            and still inside its reset timeout, True otherwise
+        """
+        if self.agent is None:
+            return False
+
+        now = datetime.now(timezone.utc)
+        for server_name, breaker in self._breakers.items():
+            if breaker.current_state != STATE_OPEN:
+                continue
+            # A breaker that opened without our listener starts its timeout now
+            opened_at = self._breaker_listener.opened_at.setdefault(breaker, now)
+            # After the reset timeout the agent runs again, and pybreaker lets its
+            # first tool call through as the half-open trial
+            if now < opened_at + timedelta(seconds=breaker.reset_timeout):
+                logger.debug("Circuit open for MCP server '%s'", server_name)
+                return False
+
+        return True
+
+    def _load_encoding(self):
+        """
+        Load the tiktoken encoding for the configured model.
+
+        Returns:
+            tiktoken Encoding, or None if tiktoken is unavailable
+        """
+        if tiktoken is None:
+            logger.warning("tiktoken not installed, using character-based token estimates")
+            return None
+
+        try:
+            try:
+                return tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                logger.warning(f"Model {self.model} not found in tiktoken, using cl100k_base")
+                return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning(f"Tokenizer unavailable, using character-based token estimates: {e}")
+            return None
+
     async def _mcp_connection_lifecycle(self, url: str, server_name: str, ready_event: asyncio.Event) -> None:
         """
         Background task that manages MCP connection lifecycle for a specific server.
@@ -109,6 +241,15 @@ class LLMAgentService:
                 # Enter MCP session context
                 async with ClientSession(read_stream, write_stream) as session:
                     self.mcp_sessions[server_name] = session
+                    self._server_semaphores[server_name] = asyncio.Semaphore(
+                        self.mcp_max_concurrent_calls
+                    )
+                    self._breakers[server_name] = CircuitBreaker(
+                        fail_max=5,
+                        reset_timeout=60,
+                        name=server_name,
+                        listeners=[self._breaker_listener],
+                    )
 
                     # Initialize session
                     await session.initialize()
@@ -139,7 +280,7 @@ class LLMAgentService:
 
         except httpx.ReadTimeout:
             # Expected timeout on idle SSE connection - this is non-critical
-            logger.debug(f"{server_name} MCP SSE connection timed out (expected for idle connections)")
+            logger.debug("%s MCP SSE connection timed out (expected for idle connections)", server_name)
             ready_event.set()  # Tools are already registered, this is fine
         except Exception as e:
             logger.error(f"{server_name} MCP connection lifecycle error: {e}", exc_info=True)
@@ -176,15 +317,15 @@ class LLMAgentService:
         try:
             logger.info(f"Initializing {len(mcp_servers)} MCP server(s)...")
 
-            # Create background task for each MCP server
+            # Create ready event for each MCP server
+            servers = []
             for server_name, server_url in mcp_servers:
                 ready_event = asyncio.Event()
                 self._mcp_ready_events.append(ready_event)
+                servers.append((server_name, server_url, ready_event))
 
-                task = asyncio.create_task(
-                    self._mcp_connection_lifecycle(server_url, server_name, ready_event)
-                )
-                self._mcp_tasks.append(task)
+            # Run all lifecycle tasks under one supervised TaskGroup
+            self._mcp_supervisor = asyncio.create_task(self._supervise_mcp_connections(servers))
 
             # Wait for all MCP servers to be ready (with timeout)
             try:
@@ -202,13 +343,38 @@ class LLMAgentService:
 
             except asyncio.TimeoutError:
                 logger.error("MCP initialization timed out after 30s")
-                # Cancel all tasks
-                for task in self._mcp_tasks:
-                    task.cancel()
+                # Cancelling the supervisor cancels every lifecycle task
+                self._mcp_supervisor.cancel()
 
         except Exception as e:
             logger.error(f"Failed to initialize MCP: {e}", exc_info=True)
 
+    async def _supervise_mcp_connections(
+        self,
+        servers: List[Tuple[str, str, asyncio.Event]]
+    ) -> None:
+        """
+        Own all MCP lifecycle tasks in a single TaskGroup until cancelled.
+
+        Cancelling this task cancels every connection task and waits for their
+        context managers to exit, so no lifecycle task outlives the service.
+
+        Args:
+            servers: (server_name, url, ready_event) for each MCP server
+        """
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for server_name, server_url, ready_event in servers:
+                    self._mcp_tasks.append(task_group.create_task(
+                        self._mcp_connection_lifecycle(server_url, server_name, ready_event)
+                    ))
+        except* Exception as eg:
+            logger.error(f"MCP connection tasks failed: {eg.exceptions}")
+        finally:
+            # Unblock initialize_mcp if a task failed before signalling ready
+            for _, _, ready_event in servers:
+                ready_event.set()
+
     def _create_pydantic_model_from_schema(self, tool_name: str, input_schema: dict) -> type[BaseModel]:
         """
         Create a Pydantic model from MCP tool input schema.
@@ -266,14 +432,14 @@ class LLMAgentService:
                     mcp_tool.name,
                     mcp_tool.inputSchema
                 )
-                logger.debug(f"Created Pydantic schema for tool '{mcp_tool.name}': {args_schema}")
+                logger.debug("Created Pydantic schema for tool '%s': %s", mcp_tool.name, args_schema)
             except Exception as e:
                 logger.warning(f"Failed to create schema for tool '{mcp_tool.name}': {e}")
 
         async def tool_func(**kwargs) -> str:
             """Execute the MCP tool."""
             try:
-                logger.debug(f"Calling MCP tool '{mcp_tool.name}' from {server_name} with arguments: {kwargs}")
+                logger.debug("Calling MCP tool '%s' from %s with arguments: %s", mcp_tool.name, server_name, kwargs)
 
                 # Get the session for this server
                 session = self.mcp_sessions.get(server_name)
@@ -281,49 +447,71 @@ class LLMAgentService:
                     logger.error(f"No MCP session found for server '{server_name}'")
                     return f"Error: MCP server '{server_name}' not connected"
 
-                result = await session.call_tool(
-                    name=mcp_tool.name,
-                    arguments=kwargs
-                )
-
-                logger.debug(f"MCP tool '{mcp_tool.name}' returned: {type(result)}")
-
-                # Extract text content from result
-                if hasattr(result, 'content') and result.content:
-                    if isinstance(result.content, list):
-                        # Concatenate all text content
-                        text_parts = []
-                        for item in result.content:
-                            if hasattr(item, 'text'):
-                                text_parts.append(str(item.text))
-                            else:
-                                text_parts.append(str(item))
-                        return "\n".join(text_parts)
-                    elif hasattr(result.content, 'text'):
-                        return result.content.text
+                # Fail fast while the server's circuit is open
+                async with self._server_semaphores[server_name]:
+                    with self._breakers[server_name].calling():
+                        result = await session.call_tool(
+                            name=mcp_tool.name,
+                            arguments=kwargs
+                        )
+
+                # Extract text content from result (single text block is the common case)
+                content = getattr(result, 'content', None)
+                if not content:
+                    return str(result)
+
+                text = getattr(content, 'text', None)
+                if text is not None:
+                    return text
+
+                if isinstance(content, list):
+                    # Fast path: all items are text content
+                    try:
+                        return "\n".join(map(_get_text, content))
+                    except (AttributeError, TypeError):
+                        # Mixed content: non-text items fall back to str()
+                        return "\n".join(str(getattr(item, 'text', item)) for item in content)
 
                 return str(result)
 
+            except CircuitBreakerError:
+                logger.warning(f"Circuit open for MCP server '{server_name}', skipping tool {mcp_tool.name}")
+                return f"Tool temporarily unavailable (circuit open for {server_name})"
+
             except Exception as e:
                 logger.error(f"Error calling MCP tool {mcp_tool.name}: {e}", exc_info=True)
                 return f"Error: {str(e)}"
 
         # Create LangChain StructuredTool with proper schema
-        return StructuredTool.from_function(
-            name=mcp_tool.name,
-            description=mcp_tool.description or f"MCP tool: {mcp_tool.name}",
-            coroutine=tool_func,
-            args_schema=args_schema,  # Provide the Pydantic model
-        )
+        tool_kwargs = {
+            "name": mcp_tool.name,
+            "description": mcp_tool.description or f"MCP tool: {mcp_tool.name}",
+            "coroutine": tool_func,
+        }
+        if args_schema is not None:
+            # Only pass the Pydantic model when we have one; an explicit None
+            # sends LangChain down its signature-inference path
+            tool_kwargs["args_schema"] = args_schema
+        return StructuredTool.from_function(**tool_kwargs)
 
     def _create_agent(self):
-        """Create LangGraph agent with MCP tools."""
+        """
+        Create LangGraph agent with MCP tools.
+
+        Compiling the agent graph is expensive, so it is only rebuilt when the
+        set of registered tools changes.
+        """
         if not self.mcp_tools:
             logger.warning("No MCP tools available, skipping agent creation")
             return
 
+        fingerprint = tuple(sorted(tool.name for tool in self.mcp_tools))
+        if self.agent is not None and fingerprint == self._agent_tools_fingerprint:
+            logger.debug("LangGraph agent already built for current tools, reusing it")
+            return
+
         # Get system prompt
-        system_prompt = persona_service.get_system_prompt()
+        system_prompt = self._system_message().content
         system_message = system_prompt + "\n\nYou have access to tools. Use them when they would be helpful to answer the user's question."
 
         # Create react agent with tools
@@ -333,29 +521,167 @@ class LLMAgentService:
             prompt=SystemMessage(content=system_message)
         )
 
+        self._agent_tools_fingerprint = fingerprint
         logger.info("LangGraph agent created with MCP tools")
 
-    def _build_conversation_context(
+    def _get_cached_summary(self, conversation_id: Optional[str]) -> Optional[str]:
+        """
+        Get the stored rolling summary for a conversation.
+
+        Args:
+            conversation_id: Conversation to look up (None means no summary)
+
+        Returns:
+            Summary text, or None if the conversation has none
+        """
+        entry = self._conversation_summaries.get(conversation_id) if conversation_id else None
+        if entry is None:
+            return None
+        self._conversation_summaries.move_to_end(conversation_id)
+        return entry[0]
+
+    def _schedule_summary_update(
         self,
+        conversation_id: Optional[str],
         conversation_messages: List[Message]
+    ) -> None:
+        """
+        Update a conversation's rolling summary in a background task.
+
+        At most one update runs per conversation; messages are snapshotted
+        first so the task does not touch ORM instances after their session ends.
+
+        Args:
+            conversation_id: Conversation the messages belong to (None disables summaries)
+            conversation_messages: Previous messages in conversation (oldest first)
+        """
+        if not conversation_id or conversation_id in self._summary_tasks:
+            return
+        if len(conversation_messages) <= self.max_context_messages * 2:
+            return  # Nothing evicted, nothing to summarize
+
+        snapshot = [
+            _MessageSnapshot(msg.id, msg.sender_type, msg.content)
+            for msg in conversation_messages
+        ]
+        task = asyncio.create_task(self._update_conversation_summary(conversation_id, snapshot))
+        self._summary_tasks[conversation_id] = task
+        task.add_done_callback(lambda _: self._summary_tasks.pop(conversation_id, None))
+
+    async def _update_conversation_summary(
+        self,
+        conversation_id: Optional[str],
+        conversation_messages: Sequence[_MessageSnapshot]
+    ) -> Optional[str]:
+        """
+        Fold history evicted from the sliding window into a rolling summary.
+
+        Only messages evicted since the last call are summarized, so the work
+        per turn is proportional to the new messages, not the whole history.
+
+        Args:
+            conversation_id: Conversation the messages belong to (None disables summaries)
+            conversation_messages: Snapshots of previous messages (oldest first);
+                runs in a background task, so never ORM instances
+
+        Returns:
+            Summary of evicted history, or None if there is none
+        """
+        if not conversation_id:
+            return None
+
+        cached_summary, last_summarized_id = self._conversation_summaries.get(
+            conversation_id, (None, None)
+        )
+
+        window = self.max_context_messages * 2
+        overflow = conversation_messages[:-window] if len(conversation_messages) > window else []
+        if not overflow:
+            return cached_summary
+
+        # Only summarize messages evicted since the last summary
+        evicted_ids = [msg.id for msg in overflow]
+        if last_summarized_id in evicted_ids:
+            new_messages = overflow[evicted_ids.index(last_summarized_id) + 1:]
+        else:
+            new_messages = overflow
+        if not new_messages:
+            return cached_summary
+
+        transcript = "\n".join(
+            f"{'Lukas' if msg.sender_type == 'bot' else 'User'}: {msg.content}"
+            for msg in new_messages
+        )
+        prompt = (
+            "Update the running summary of this conversation with the new messages. "
+            "Keep names, facts, decisions and open questions. Reply with the summary only.\n\n"
+            f"Current summary:\n{cached_summary or '(none)'}\n\n"
+            f"New messages:\n{transcript}"
+        )
+
+        try:
+            response = await self.summary_llm.ainvoke([HumanMessage(content=prompt)])
+            summary = response.content if hasattr(response, 'content') else str(response)
+        except Exception as e:
+            logger.warning(f"Failed to summarize conversation {conversation_id}: {e}")
+            return cached_summary
+
+        if not summary or not summary.strip():
+            return cached_summary
+
+        self._conversation_summaries[conversation_id] = (summary, new_messages[-1].id)
+        self._conversation_summaries.move_to_end(conversation_id)
+        if len(self._conversation_summaries) > _MAX_CACHED_SUMMARIES:
+            self._conversation_summaries.popitem(last=False)
+        logger.debug("Summarized %s evicted messages for conversation %s", len(new_messages), conversation_id)
+        return summary
+
+    def _build_conversation_context(
+        self,
+        conversation_messages: List[Message],
+        summary: Optional[str] = None
     ) -> List:
         """
         Build conversation history for agent.
 
         Args:
             conversation_messages: Previous messages in conversation
+            summary: Optional summary of history older than the sliding window
 
         Returns:
-            List of LangChain message objects
+            List of LangChain message objects (bounded by the history token budget)
         """
         messages = []
+        total_tokens = 0
+
+        if summary:
+            summary_content = f"Conversation summary so far: {summary}"
+            messages.append(SystemMessage(content=summary_content))
+            # The summary is an extra message, so its overhead isn't reserved
+            total_tokens += self.estimate_tokens(summary_content) + TOKENS_PER_MESSAGE
+
+        # Walk history newest to oldest until the token budget or the
+        # message-pair cap is reached (will reverse later)
+        included_messages = []
+        for msg in reversed(conversation_messages):
+            if len(included_messages) >= self.max_context_messages * 2:
+                logger.debug("Context truncated: reached %s message pairs", self.max_context_messages)
+                break
+
+            # Prefer the count stored with the message (overhead is in the budget)
+            msg_tokens = msg.token_count or self.estimate_tokens(msg.content)
+            if total_tokens + msg_tokens > self._history_budget:
+                logger.debug("Context truncated: would exceed %s tokens", self.max_tokens_per_request)
+                break
 
-        # Add recent conversation history (sliding window)
-        for msg in conversation_messages[-self.max_context_messages * 2:]:
             if msg.sender_type == "bot":
-                messages.append(AIMessage(content=msg.content))
+                included_messages.append(AIMessage(content=msg.content))
             else:
-                messages.append(HumanMessage(content=msg.content))
+                included_messages.append(HumanMessage(content=msg.content))
+            total_tokens += msg_tokens
+
+        # Reverse to get chronological order
+        messages.extend(reversed(included_messages))
 
         return messages
 
@@ -382,9 +708,10 @@ class LLMAgentService:
         try:
             if use_tools and self.agent:
                 # Use LangGraph agent with tools
-                messages = chat_history or []
-
-                # Inject user context as system message if provided
+                # Inject user context as a system message right before the user turn.
+                # The persona prompt and history stay an identical prefix across users,
+                # which keeps OpenAI's automatic prompt caching effective.
+                context = []
                 if user_context:
                     context_msg = (
                         f"\n\nCurrent conversation context:\n"
@@ -394,56 +721,53 @@ class LLMAgentService:
                         f"(like generate_and_post_image, update_bot_config, create_reminder), "
                         f"use the Slack User ID provided above. DO NOT ask the user for their ID."
                     )
-                    messages.insert(0, SystemMessage(content=context_msg))
+                    context.append(SystemMessage(content=context_msg))
 
-                messages.append(HumanMessage(content=user_message))
+                # Build the message list in a single allocation
+                messages = [*(chat_history or ()), *context, HumanMessage(content=user_message)]
 
-                logger.info(f"Calling agent with {len(messages)} messages, use_tools={use_tools}")
-                if user_context:
-                    logger.info(f"User context: {user_context['user_name']} ({user_context['user_id']})")
-                logger.info(f"User message: {user_message[:100]}...")
+                logger.info("Calling agent with %d messages", len(messages))
+                if logger.isEnabledFor(logging.DEBUG):
+                    if user_context:
+                        logger.debug("User context: %s (%s)", user_context['user_name'], user_context['user_id'])
+                    logger.debug("User message: %.100s", user_message)
 
                 result = await self.agent.ainvoke({"messages": messages})
 
-                logger.info(f"Agent returned result type: {type(result)}")
-                logger.info(f"Agent result keys: {result.keys() if isinstance(result, dict) else 'not a dict'}")
-
                 # Extract the final message from the result
                 if isinstance(result, dict) and "messages" in result:
-                    logger.info(f"Result has {len(result['messages'])} messages")
                     final_message = result["messages"][-1]
-                    logger.info(f"Final message type: {type(final_message).__name__}")
-                    logger.info(f"Final message content preview: {str(final_message)[:200]}...")
-
                     response = final_message.content if hasattr(final_message, 'content') else str(final_message)
-                    logger.info(f"Extracted response length: {len(response) if response else 0}")
 
-                    if response:
-                        logger.info(f"Response preview: {response[:200]}...")
-                    else:
-                        logger.warning("Response is empty!")
-                        logger.warning(f"Final message details: {final_message}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Agent returned %d messages, final %s (%d chars)",
+                            len(result["messages"]),
+                            type(final_message).__name__,
+                            len(response) if response else 0,
+                        )
+                        logger.debug("Response preview: %.200s", response)
+
+                    if not response:
+                        logger.warning("Agent returned empty response, final message: %s", final_message)
 
                     return response
 
-                logger.warning(f"Unexpected agent result format: {result}")
+                logger.warning("Unexpected agent result format: %s", result)
                 return str(result)
             else:
                 # Fallback to direct LLM call
                 logger.debug("Using direct LLM call (no tools)")
-                system_prompt = persona_service.get_system_prompt()
-                messages = [SystemMessage(content=system_prompt)]
+                messages = [
+                    self._system_message(),
+                    *(chat_history or ()),
+                    HumanMessage(content=user_message),
+                ]
 
-                if chat_history:
-                    messages.extend(chat_history)
-
-                messages.append(HumanMessage(content=user_message))
-
-                logger.debug(f"Calling LLM with {len(messages)} messages")
+                logger.debug("Calling LLM with %d messages", len(messages))
                 response = await self.llm.ainvoke(messages)
-                logger.debug(f"LLM response type: {type(response)}, has content: {hasattr(response, 'content')}")
                 content = response.content if hasattr(response, 'content') else str(response)
-                logger.debug(f"LLM response length: {len(content) if content else 0}")
+                logger.debug("LLM response length: %d", len(content) if content else 0)
                 return content
 
         except Exception as e:
@@ -456,6 +780,7 @@ class LLMAgentService:
         user_message: str,
         user_id: Optional[str] = None,
         user_name: Optional[str] = None,
+        conversation_id: Optional[str] = None,
     ) -> str:
         """
         Generate AI response with tool access and fallback.
@@ -465,71 +790,71 @@ class LLMAgentService:
             user_message: Latest user message
             user_id: Slack user ID for tool calls (optional)
             user_name: User's display name for context (optional)
+            conversation_id: Conversation ID for rolling history summaries (optional)
 
         Returns:
             AI-generated response or fallback
         """
-        try:
-            # Build conversation context
-            chat_history = self._build_conversation_context(conversation_messages)
-
-            # Build user context for tool calls
-            user_context = None
-            if user_id:
-                user_context = {
-                    "user_id": user_id,
-                    "user_name": user_name or "Unknown"
-                }
-
-            # Call agent (we're already in an async context, just await)
-            response = await self._call_agent(
-                user_message,
-                chat_history,
-                use_tools=True,
-                user_context=user_context
-            )
-
-            if not response or not response.strip():
-                logger.warning("Agent returned empty response, using fallback")
-                raise ValueError("Empty response from agent")
-
-            logger.info(f"Generated response ({len(response)} chars)")
-            return response
-
-        except Exception as e:
-            logger.error(f"Error generating response: {e}")
-
-            # Try without tools as fallback
+        # Reply with the summary as of the previous turn; newly evicted history is
+        # folded in off the reply path and picked up by the next reply
+        summary = self._get_cached_summary(conversation_id)
+        self._schedule_summary_update(conversation_id, conversation_messages)
+
+        # Build conversation context (shared by the agent call and the fallback)
+        chat_history = self._build_conversation_context(conversation_messages, summary)
+
+        # Build user context for tool calls
+        user_context = None
+        if user_id:
+            user_context = {
+                "user_id": user_id,
+                "user_name": user_name or "Unknown"
+            }
+
+        if self._tools_available():
             try:
-                logger.info("Attempting fallback without tools...")
-                chat_history = self._build_conversation_context(conversation_messages)
-
-                # Build user context for fallback
-                user_context = None
-                if user_id:
-                    user_context = {
-                        "user_id": user_id,
-                        "user_name": user_name or "Unknown"
-                    }
-
+                # Call agent (we're already in an async context, just await)
                 response = await self._call_agent(
                     user_message,
                     chat_history,
-                    use_tools=False,
+                    use_tools=True,
                     user_context=user_context
                 )
 
                 if not response or not response.strip():
-                    raise ValueError("Empty response from fallback")
+                    logger.warning("Agent returned empty response, using fallback")
+                    raise ValueError("Empty response from agent")
 
-                logger.info("Fallback successful")
+                logger.info(f"Generated response ({len(response)} chars)")
                 return response
-            except Exception as fallback_error:
-                logger.error(f"Fallback also failed: {fallback_error}", exc_info=True)
-                # Final fallback to persona service
-                fallback = persona_service.get_fallback_response()
-                logger.warning(f"Using emergency fallback response: '{fallback}'")
-                return fallback
+
+            except Exception as e:
+                logger.error(f"Error generating response: {e}")
+        else:
+            # Skip the agent (and its retries) when tools are known to be down
+            logger.info("MCP tools unavailable, skipping agent call")
+
+        # Try without tools as fallback
+        try:
+            logger.info("Attempting fallback without tools...")
+            response = await self._call_agent(
+                user_message,
+                chat_history,
+                use_tools=False,
+                user_context=user_context
+            )
+
+            if not response or not response.strip():
+                raise ValueError("Empty response from fallback")
+
+            logger.info("Fallback successful")
+            return response
+        except Exception as fallback_error:
+            logger.error(f"Fallback also failed: {fallback_error}", exc_info=True)
+            # Final fallback to persona service
+            fallback = persona_service.get_fallback_response()
+            logger.warning(f"Using emergency fallback response: '{fallback}'")
+            return fallback
 
     def estimate_tokens(self, text: str) -> int:
         """
@@ -543,10 +868,12 @@ class LLMAgentService:
         Returns:
             Estimated token count
         """
+        if self._encoding is None:
+            # Rough fallback: ~4 chars per token
+            return len(text) // 4
+
         try:
-            import tiktoken
-            encoding = tiktoken.encoding_for_model(self.model)
-            return len(encoding.encode(text))
+            return len(self._encoding.encode_ordinary(text))
         except Exception:
             # Rough fallback: ~4 chars per token
             return len(text) // 4
@@ -554,21 +881,15 @@ class LLMAgentService:
     async def cleanup(self):
         """Clean up MCP connections gracefully."""
         try:
-            if self._mcp_tasks:
+            if self._mcp_supervisor is not None and not self._mcp_supervisor.done():
                 logger.info(f"Cancelling {len(self._mcp_tasks)} MCP background task(s)...")
 
-                for task in self._mcp_tasks:
-                    if not task.done():
-                        task.cancel()
-
-                # Wait for all tasks to complete
-                results = await asyncio.gather(*self._mcp_tasks, return_exceptions=True)
-
-                for i, result in enumerate(results):
-                    if isinstance(result, asyncio.CancelledError):
-                        logger.debug(f"MCP task {i} cancelled successfully")
-                    elif isinstance(result, Exception):
-                        logger.warning(f"Error during MCP task {i} cancellation: {result}")
+                # TaskGroup cancels and awaits all lifecycle tasks on the way out
+                self._mcp_supervisor.cancel()
+                try:
+                    await self._mcp_supervisor
+                except asyncio.CancelledError:
+                    logger.debug("MCP supervisor cancelled successfully")
 
             logger.info("MCP connections closed")
         except Exception as e:
@@ -6,6 +6,7 @@ Includes context management, retry logic, and circuit breaker.
 """
 
 import os
+from functools import lru_cache
 from typing import List, Dict, Optional
 
 import tiktoken
@@ -16,6 +17,25 @@ from src.models.message import Message
 from src.services.persona_service import persona_service
 from src.utils.logger import logger
 from src.utils.retry import retry_on_api_error
+from src.utils.tokens import history_token_budget
+
+
+@lru_cache(maxsize=8)
+def _get_tokenizer(model: str) -> tiktoken.Encoding:
+    """
+    Get the tiktoken encoding for a model, loading each BPE table once per process.
+
+    Args:
+        model: LLM model name
+
+    Returns:
+        tiktoken Encoding (cl100k_base if the model is unknown to tiktoken)
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        logger.warning(f"Model {model} not found in tiktoken, using cl100k_base")
+        return tiktoken.get_encoding("cl100k_base")
 
 
 class LLMService:
@@ -51,6 +71,13 @@ class LLMService:
         self.max_context_messages = max_context_messages
         self.max_tokens_per_request = max_tokens_per_request
         self.max_response_tokens = max_response_tokens
+        # Messages callers should load per request; older ones never fit the window
+        self.history_limit = max_context_messages * 2
+        # Budget for message content, with the response and per-message overhead
+        # reserved up front
+        self._effective_budget = history_token_budget(
+            max_tokens_per_request, max_response_tokens, self.history_limit
+        )
 
         # Initialize OpenAI client
         api_key = os.getenv("OPENAI_API_KEY")
@@ -60,12 +87,11 @@ class LLMService:
 
         self.client = OpenAI(api_key=api_key)
 
-        # Initialize tokenizer for token counting
-        try:
-            self.tokenizer = tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            logger.warning(f"Model {self.model} not found in tiktoken, using cl100k_base")
-            self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        # Initialize tokenizer for token counting (shared across instances)
+        self.tokenizer = _get_tokenizer(self.model)
+
+        # Prompt token counts, so the static system prompt is encoded only once
+        self._count_text_tokens = lru_cache(maxsize=256)(self.estimate_tokens)
 
         # Circuit breaker for sustained failures
         self.circuit_breaker = CircuitBreaker(
@@ -86,12 +112,43 @@ class LLMService:
             Estimated token count
         """
         try:
-            return len(self.tokenizer.encode(text))
+            # Message content is plain text, so skip the special-token scan
+            return len(self.tokenizer.encode_ordinary(text))
         except Exception as e:
             logger.error(f"Error estimating tokens: {e}")
             # Rough estimate: ~4 characters per token
             return len(text) // 4
 
+    def _count_message_tokens(self, messages: List[Message]) -> List[int]:
+        """
+        Get token counts for messages' content.
+
+        Uses the token_count persisted when the message was stored; messages
+        without one are encoded together in one batch call.
+
+        Args:
+            messages: List of Message objects
+
+        Returns:
+            Estimated token counts (without per-message overhead), in input order
+        """
+        token_counts = [m.token_count for m in messages]
+        uncached = [i for i, tokens in enumerate(token_counts) if not tokens]
+        if not uncached:
+            return token_counts
+
+        contents = [messages[i].content for i in uncached]
+        try:
+            encoded = self.tokenizer.encode_ordinary_batch(contents, num_threads=4)
+            counts = [len(tokens) for tokens in encoded]
+        except Exception as e:
+            logger.error(f"Error batch-estimating tokens: {e}")
+            counts = [self.estimate_tokens(content) for content in contents]
+
+        for i, tokens in zip(uncached, counts, strict=True):
+            token_counts[i] = tokens
+        return token_counts
+
     def build_conversation_context(self, messages: List[Message]) -> List[Dict[str, str]]:
         """
         Build conversation context from message history.
@@ -104,44 +161,72 @@ class LLMService:
         Returns:
             List of message dicts for OpenAI API
         """
-        # Get system prompt
+        # Get system prompt (static, so it forms a cacheable prompt prefix)
         system_prompt = persona_service.get_system_prompt()
         context = [
             {"role": "system", "content": system_prompt}
         ]
 
-        # Calculate system prompt tokens
-        total_tokens = self.estimate_tokens(system_prompt)
+        # New conversations and one-off prompts have no history to fit
+        if not messages:
+            return context
 
-        # Add messages from newest to oldest (will reverse later)
+        # Calculate system prompt tokens (content only; overhead is in the budget)
+        total_tokens = self._count_text_tokens(system_prompt)
+
+        # Only the newest message pairs can fit; estimate their tokens in one batch
+        window = messages[-self.max_context_messages * 2:]
+        if len(window) < len(messages):
+            logger.debug("Context truncated: reached %s message pairs", self.max_context_messages)
+
+        # Every token covers at least one UTF-8 byte, so byte length is an upper
+        # bound on token count. If the window fits by that bound, skip tokenizing.
+        byte_counts = [len(m.content.encode("utf-8")) for m in window]
+        tokenized = total_tokens + sum(byte_counts) > self._effective_budget
+        token_counts = self._count_message_tokens(window) if tokenized else byte_counts
+
+        # Walk messages newest to oldest (the window above already bounds the count)
         included_messages = []
-        for message in reversed(messages):
+        for message, tokens in zip(reversed(window), reversed(token_counts), strict=True):
             # Convert to OpenAI format
             role = "assistant" if message.sender_type == "bot" else "user"
             msg_dict = {"role": role, "content": message.content}
 
-            # Estimate tokens
-            msg_tokens = self.estimate_tokens(message.content) + 4  # 4 tokens overhead per message
-
-            # Check if adding this message would exceed limits
-            if total_tokens + msg_tokens > self.max_tokens_per_request:
-                logger.debug(f"Context truncated: would exceed {self.max_tokens_per_request} tokens")
-                break
-
-            # Check if we've hit message pair limit
-            if len(included_messages) >= self.max_context_messages * 2:
-                logger.debug(f"Context truncated: reached {self.max_context_messages} message pairs")
+            # Check if adding this message would exceed the token budget
+            if total_tokens + tokens > self._effective_budget:
+                logger.debug("Context truncated: would exceed %s tokens", self.max_tokens_per_request)
                 break
 
             included_messages.append(msg_dict)
-            total_tokens += msg_tokens
+            total_tokens += tokens
 
-        # Reverse to get chronological order
-        context.extend(reversed(included_messages))
+        # Back to chronological order
+        included_messages.reverse()
+        context.extend(included_messages)
 
-        logger.debug(f"Built context with {len(included_messages)} messages (~{total_tokens} tokens)")
+        if tokenized:
+            logger.debug("Built context with %s messages (~%s content tokens)", len(included_messages), total_tokens)
+        else:
+            # The counts are byte lengths, only an upper bound on tokens
+            logger.debug("Built context with %s messages (fits by byte length, not tokenized)", len(included_messages))
         return context
 
+    def _log_prompt_cache_usage(self, response) -> None:
+        """
+        Log how many prompt tokens were served from OpenAI's prompt cache.
+
+        Caching only applies to an identical prompt prefix, which is why the
+        static system prompt always comes first in the context.
+
+        Args:
+            response: Chat completion response
+        """
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens is not None:
+            logger.debug("Prompt tokens: %s (cached: %s)", usage.prompt_tokens, cached_tokens)
+
     @retry_on_api_error(max_attempts=3, min_wait=1, max_wait=10)
     def _call_openai_api(self, messages: List[Dict[str, str]]) -> str:
         """
@@ -163,6 +248,7 @@ class LLMService:
                 max_completion_tokens=self.max_response_tokens,
                 # temperature removed - some models only support default (1)
             )
+            self._log_prompt_cache_usage(response)
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
@@ -216,5 +302,5 @@ class LLMService:
         return self.estimate_tokens(content)
 
 
-# Global LLM service instance
+# Global LLM service instance (also pre-warms the tokenizer at import time)
 llm_service = LLMService()
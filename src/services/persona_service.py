@@ -7,12 +7,28 @@ Manages Lukas the Bear's personality and system prompt generation.
 import random
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
 from src.utils.logger import logger
 
+# Time-of-day bucket for each hour (0-23), used by greeting templates
+_HOUR_TO_TOD = (
+    ("night",) * 5        # 0-4
+    + ("morning",) * 7    # 5-11
+    + ("afternoon",) * 5  # 12-16
+    + ("evening",) * 5    # 17-21
+    + ("night",) * 2      # 22-23
+)
+
+
+class _TemplateValues(dict):
+    """Placeholder values for str.format_map that leave unknown placeholders as-is."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
 
 class PersonaService:
     """
@@ -31,24 +47,52 @@ class PersonaService:
         """
         self.persona_file = persona_file
         self.config: Dict = {}
+        self._system_prompt: Optional[str] = None  # Cached, reset on config reload
         self._load_persona_config()
 
     def _load_persona_config(self) -> None:
         """Load persona configuration from YAML file."""
+        self._system_prompt = None
         persona_path = Path(self.persona_file)
 
         if not persona_path.exists():
             logger.warning(f"Persona file {self.persona_file} not found, using defaults")
             self.config = self._get_default_config()
-            return
+        else:
+            try:
+                with open(persona_path, "r") as f:
+                    self.config = yaml.safe_load(f) or {}
+                logger.info(f"Loaded persona configuration from {persona_path}")
+            except Exception as e:
+                logger.error(f"Error loading persona file: {e}")
+                self.config = self._get_default_config()
+
+        self._build_choice_tables()
+
+    def _build_choice_tables(self) -> None:
+        """Precompute the random-choice pools from the loaded config."""
+        self._fallbacks: Tuple[str, ...] = tuple(self.config.get("fallback_responses", (
+            "I'm having trouble thinking right now. Can you try again?",
+        )))
+        # (greeting, has_placeholders) so static greetings skip formatting entirely
+        self._greetings: Tuple[Tuple[str, bool], ...] = tuple(
+            (greeting, self._is_template(greeting))
+            for greeting in self.config.get("greeting_templates", ("Hi there!",))
+        )
+        self._captions: Tuple[str, ...] = tuple(self.config.get("image_captions", (
+            "Here's a little bear art to brighten your day! 🐻✨",
+        )))
 
-        try:
-            with open(persona_path, "r") as f:
-                self.config = yaml.safe_load(f) or {}
-            logger.info(f"Loaded persona configuration from {persona_path}")
-        except Exception as e:
-            logger.error(f"Error loading persona file: {e}")
-            self.config = self._get_default_config()
+        prompts_config = self.config.get("image_prompts", {})
+        self._seasonal_prompts: Dict[str, Tuple[str, ...]] = {
+            k: tuple(v) for k, v in prompts_config.get("seasonal", {}).items()
+        }
+        self._occasion_prompts: Dict[str, Tuple[str, ...]] = {
+            k: tuple(v) for k, v in prompts_config.get("special_occasions", {}).items()
+        }
+        self._default_prompts: Tuple[str, ...] = tuple(prompts_config.get("default", (
+            "A friendly cartoon bear mascot, digital art, warm colors",
+        )))
 
     def _get_default_config(self) -> Dict:
         """Get default persona configuration."""
@@ -60,6 +104,26 @@ class PersonaService:
             "greeting_templates": ["Hi there!"],
         }
 
+    @staticmethod
+    def _is_template(text: str) -> bool:
+        """
+        Check whether text contains valid str.format_map placeholders.
+
+        Args:
+            text: Template text from the persona config
+
+        Returns:
+            True if the text has placeholders and formats cleanly
+        """
+        if "{" not in text:
+            return False
+        try:
+            text.format_map(_TemplateValues())
+        except Exception as e:
+            logger.warning(f"Malformed persona template {text!r}, using it verbatim: {e}")
+            return False
+        return True
+
     def get_system_prompt(self, context: Optional[Dict] = None) -> str:
         """
         Generate system prompt for Lukas.
@@ -70,11 +134,14 @@ class PersonaService:
         Returns:
             System prompt string
         """
-        base_prompt = self.config.get("system_prompt", "You are Lukas the Bear.")
+        # The prompt is static per loaded config, so build it once and reuse it.
+        # Returning the identical string also keeps downstream token-count caches warm.
+        if self._system_prompt is None:
+            self._system_prompt = self.config.get("system_prompt", "You are Lukas the Bear.")
 
         # Add any context-specific additions
         # For now, just return the base prompt
-        return base_prompt
+        return self._system_prompt
 
     def get_fallback_response(self) -> str:
         """
@@ -83,10 +150,7 @@ class PersonaService:
         Returns:
             Fallback response string
         """
-        fallbacks = self.config.get("fallback_responses", [
-            "I'm having trouble thinking right now. Can you try again?"
-        ])
-        return random.choice(fallbacks)
+        return random.choice(self._fallbacks)
 
     def get_greeting_template(self) -> str:
         """
@@ -95,21 +159,12 @@ class PersonaService:
         Returns:
             Greeting template string
         """
-        greetings = self.config.get("greeting_templates", ["Hi there!"])
-        greeting = random.choice(greetings)
-
-        # Replace time_of_day placeholder
-        hour = datetime.now().hour
-        if 5 <= hour < 12:
-            time_of_day = "morning"
-        elif 12 <= hour < 17:
-            time_of_day = "afternoon"
-        elif 17 <= hour < 22:
-            time_of_day = "evening"
-        else:
-            time_of_day = "night"
+        greeting, is_template = random.choice(self._greetings)
 
-        return greeting.replace("{time_of_day}", time_of_day)
+        # Fill in placeholders such as {time_of_day} (most greetings have none)
+        if not is_template:
+            return greeting
+        return greeting.format_map(_TemplateValues(time_of_day=_HOUR_TO_TOD[datetime.now().hour]))
 
     def get_image_caption(self) -> str:
         """
@@ -118,10 +173,7 @@ class PersonaService:
         Returns:
             Image caption string
         """
-        captions = self.config.get("image_captions", [
-            "Here's a little bear art to brighten your day! 🐻✨"
-        ])
-        return random.choice(captions)
+        return random.choice(self._captions)
 
     def get_image_prompt(self, occasion: Optional[str] = None) -> str:
         """
@@ -133,25 +185,15 @@ class PersonaService:
         Returns:
             Image generation prompt
         """
-        prompts_config = self.config.get("image_prompts", {})
-
         if occasion:
             # Try seasonal or special occasion prompts
-            seasonal_prompts = prompts_config.get("seasonal", {})
-            occasion_prompts = prompts_config.get("special_occasions", {})
-
-            if occasion in seasonal_prompts:
-                prompts = seasonal_prompts[occasion]
-                return random.choice(prompts)
-            elif occasion in occasion_prompts:
-                prompts = occasion_prompts[occasion]
-                return random.choice(prompts)
+            if occasion in self._seasonal_prompts:
+                return random.choice(self._seasonal_prompts[occasion])
+            elif occasion in self._occasion_prompts:
+                return random.choice(self._occasion_prompts[occasion])
 
         # Default prompts
-        default_prompts = prompts_config.get("default", [
-            "A friendly cartoon bear mascot, digital art, warm colors"
-        ])
-        return random.choice(default_prompts)
+        return random.choice(self._default_prompts)
 
     def get_emoji_reactions(self, category: str = "positive") -> List[str]:
         """
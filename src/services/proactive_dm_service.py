@@ -4,23 +4,47 @@ Proactive DM Service
 Handles sending random proactive DMs to team members to maintain engagement.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
-from unittest.mock import Mock
+from typing import Dict, Any, List, Optional
+from weakref import WeakKeyDictionary
 
 from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
 from sqlalchemy.orm import Session
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from src.models import generate_uuid
 from src.models.scheduled_task import ScheduledTask, TaskType, TaskStatus, TargetType
 from src.models.team_member import TeamMember
 from src.services.engagement_service import EngagementService
 from src.services.persona_service import PersonaService
 from src.repositories.team_member_repo import TeamMemberRepository
+from src.utils.retry import retry_on_slack_error
 
 logger = logging.getLogger(__name__)
 
+# DM channel ids are stable per user, so remember them per Slack client
+# (i.e. per workspace token) and skip conversations.open on later DMs
+_dm_channel_cache: "WeakKeyDictionary[AsyncWebClient, Dict[str, str]]" = WeakKeyDictionary()
+
+# Errors meaning a cached DM channel can no longer be posted to
+_STALE_CHANNEL_ERRORS = {"channel_not_found", "not_in_channel", "is_archived"}
+
+
+def _new_result() -> Dict[str, Any]:
+    """Build an empty random DM result dict (see ProactiveDMService.send_random_dm)."""
+    return {
+        "success": False,
+        "user_selected": None,
+        "message_sent": None,
+        "dm_channel_id": None,
+        "timestamp_updated": None,
+        "task_id": None,
+        "error": None,
+        "reason": None,
+    }
+
 
 class ProactiveDMService:
     """Service for sending proactive DMs to team members."""
@@ -44,20 +68,15 @@ class ProactiveDMService:
         self.persona_service = persona_service or PersonaService()
         self.team_member_repo = TeamMemberRepository(db_session)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(SlackApiError),
-        reraise=True,
-    )
+    @retry_on_slack_error(max_attempts=3, min_wait=2, max_wait=10)
     async def _send_slack_dm(
-        self, slack_client: Mock, user_id: str, message: str
+        self, slack_client: AsyncWebClient, user_id: str, message: str
     ) -> Dict[str, Any]:
         """
         Send a DM via Slack API with retry logic.
 
         Args:
-            slack_client: Slack WebClient instance
+            slack_client: Slack AsyncWebClient instance
             user_id: Slack user ID to send DM to
             message: Message text to send
 
@@ -65,11 +84,40 @@ class ProactiveDMService:
             dict with 'channel_id' and 'message_ts'
 
         Raises:
-            SlackApiError: If Slack API call fails after retries
+            SlackApiError: If Slack API call fails (transient errors are retried)
+        """
+        channel_cache = _dm_channel_cache.setdefault(slack_client, {})
+
+        dm_channel_id = channel_cache.get(user_id)
+        if dm_channel_id is not None:
+            try:
+                return await self._post_dm_message(slack_client, dm_channel_id, message)
+            except SlackApiError as e:
+                if e.response.get("error") not in _STALE_CHANNEL_ERRORS:
+                    raise
+                logger.info(f"Cached DM channel {dm_channel_id} for {user_id} is stale, reopening")
+                channel_cache.pop(user_id, None)
+
+        dm_channel_id = await self._open_dm_channel(slack_client, user_id)
+        channel_cache[user_id] = dm_channel_id
+        return await self._post_dm_message(slack_client, dm_channel_id, message)
+
+    async def _open_dm_channel(self, slack_client: AsyncWebClient, user_id: str) -> str:
+        """
+        Open (or look up) the DM conversation with a user.
+
+        Args:
+            slack_client: Slack AsyncWebClient instance
+            user_id: Slack user ID to open a DM with
+
+        Returns:
+            DM channel ID
+
+        Raises:
+            SlackApiError: If the conversation cannot be opened
         """
-        # Open DM conversation
-        logger.info(f"Opening DM conversation with user {user_id}")
-        dm_response = slack_client.conversations_open(users=[user_id])
+        logger.info("Opening DM conversation with user %s", user_id)
+        dm_response = await slack_client.conversations_open(users=[user_id])
 
         if not dm_response.get("ok"):
             error_msg = dm_response.get("error", "unknown_error")
@@ -80,11 +128,28 @@ class ProactiveDMService:
             )
 
         dm_channel_id = dm_response["channel"]["id"]
-        logger.info(f"DM channel opened: {dm_channel_id}")
+        logger.info("DM channel opened: %s", dm_channel_id)
+        return dm_channel_id
 
-        # Send message
-        logger.info(f"Sending message to channel {dm_channel_id}")
-        msg_response = slack_client.chat_postMessage(
+    async def _post_dm_message(
+        self, slack_client: AsyncWebClient, dm_channel_id: str, message: str
+    ) -> Dict[str, Any]:
+        """
+        Post a message to an open DM channel.
+
+        Args:
+            slack_client: Slack AsyncWebClient instance
+            dm_channel_id: DM channel ID
+            message: Message text to send
+
+        Returns:
+            dict with 'channel_id' and 'message_ts'
+
+        Raises:
+            SlackApiError: If the message cannot be sent
+        """
+        logger.info("Sending message to channel %s", dm_channel_id)
+        msg_response = await slack_client.chat_postMessage(
             channel=dm_channel_id, text=message
         )
 
@@ -117,9 +182,11 @@ class ProactiveDMService:
         Returns:
             Created ScheduledTask instance
         """
-        import uuid
+        # Derive the job id suffix from the row id instead of drawing a second UUID
+        task_id = generate_uuid()
         task = ScheduledTask(
-            job_id=f"random_dm_{user_id}_{uuid.uuid4().hex[:8]}",
+            id=task_id,
+            job_id=f"random_dm_{user_id}_{task_id[:8]}",
             task_type=TaskType.RANDOM_DM.value,
             target_type=TargetType.USER.value,
             target_id=user_id,
@@ -135,8 +202,9 @@ class ProactiveDMService:
 
     async def send_random_dm(
         self,
-        app: Mock,
-        slack_client: Mock,
+        app: Any,
+        slack_client: AsyncWebClient,
+        recipient: Optional[TeamMember] = None,
     ) -> Dict[str, Any]:
         """
         Send a random proactive DM to an eligible team member.
@@ -150,7 +218,8 @@ class ProactiveDMService:
 
         Args:
             app: Slack App instance (can be mocked for testing)
-            slack_client: Slack WebClient instance
+            slack_client: Slack AsyncWebClient instance
+            recipient: Optional preselected recipient (skips step 1)
 
         Returns:
             dict with keys:
@@ -163,96 +232,162 @@ class ProactiveDMService:
                 - error (str|None): Error message if failed
                 - reason (str|None): Reason for failure (e.g., 'no_eligible_users')
         """
-        result = {
-            "success": False,
-            "user_selected": None,
-            "message_sent": None,
-            "dm_channel_id": None,
-            "timestamp_updated": None,
-            "task_id": None,
-            "error": None,
-            "reason": None,
-        }
+        result = _new_result()
 
         try:
             # Step 1: Select recipient
-            logger.info("Selecting random DM recipient")
-            recipient = self.engagement_service.select_dm_recipient()
+            if recipient is None:
+                logger.info("Selecting random DM recipient")
+                recipient = self.engagement_service.select_dm_recipient()
+        except Exception as e:
+            logger.exception(f"Unexpected error in random DM workflow: {e}")
+            result["error"] = str(e)
+            return result
+
+        if not recipient:
+            logger.warning("No eligible users for random DM")
+            result["reason"] = "no_eligible_users"
+            return result
 
-            if not recipient:
-                logger.warning("No eligible users for random DM")
-                result["reason"] = "no_eligible_users"
-                return result
+        # Steps 2-3 talk to Slack only; steps 4-5 write to the database
+        result = await self._deliver_dm(slack_client, recipient)
+        return self._record_dm(recipient, result)
 
-            user_id = recipient.slack_user_id
-            result["user_selected"] = user_id
-            logger.info(f"Selected user {user_id} for random DM")
+    async def _deliver_dm(self, slack_client: AsyncWebClient, recipient: TeamMember) -> Dict[str, Any]:
+        """
+        Generate a greeting and send it to the recipient (steps 2-3).
+
+        Makes no database writes, so several deliveries can run concurrently
+        on one service.
 
+        Args:
+            slack_client: Slack AsyncWebClient instance
+            recipient: Team member to send the DM to
+
+        Returns:
+            Result dict (see send_random_dm) with error set if the send failed
+        """
+        result = _new_result()
+        user_id = recipient.slack_user_id
+        result["user_selected"] = user_id
+        logger.info("Selected user %s for random DM", user_id)
+
+        try:
             # Step 2: Generate greeting message
             logger.info("Generating greeting message")
             greeting = self.persona_service.get_greeting_template()
             result["message_sent"] = greeting
-            logger.debug(f"Generated greeting: {greeting}")
+            logger.debug("Generated greeting: %s", greeting)
 
             # Step 3: Send DM via Slack API
-            try:
-                slack_result = await self._send_slack_dm(
-                    slack_client, user_id, greeting
-                )
-                result["dm_channel_id"] = slack_result["channel_id"]
-                logger.info(
-                    f"Successfully sent DM to {user_id} in channel {slack_result['channel_id']}"
-                )
+            slack_result = await self._send_slack_dm(slack_client, user_id, greeting)
+            result["dm_channel_id"] = slack_result["channel_id"]
+            logger.info(
+                "Successfully sent DM to %s in channel %s", user_id, slack_result["channel_id"]
+            )
+        except SlackApiError as e:
+            logger.error(f"Slack API error sending DM: {e}")
+            result["error"] = str(e)
+        except Exception as e:
+            logger.exception(f"Unexpected error in random DM workflow: {e}")
+            result["error"] = str(e)
 
-            except SlackApiError as e:
-                logger.error(f"Slack API error sending DM: {e}")
-                result["error"] = str(e)
-                # Create failed task record
-                task = self._create_task_record(
-                    user_id, TaskStatus.FAILED, error_message=str(e)
-                )
-                result["task_id"] = task.id
-                raise  # Re-raise to prevent timestamp update
+        return result
+
+    def _record_dm(self, recipient: TeamMember, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record the outcome of a delivery in the database (steps 4-5).
+
+        On success the user's timestamp and a completed task record are
+        committed together; on failure only a failed task record is written,
+        so the timestamp is left untouched.
 
+        Args:
+            recipient: Team member the DM was sent to
+            result: Result dict returned by _deliver_dm
+
+        Returns:
+            The completed result dict
+        """
+        user_id = recipient.slack_user_id
+        if result["error"] is not None:
+            task = self._create_task_record(user_id, TaskStatus.FAILED, error_message=result["error"])
+            result["task_id"] = task.id
+            return result
+
+        try:
             # Step 4: Update user's last_proactive_dm_at timestamp
-            logger.info(f"Updating last_proactive_dm_at for user {user_id}")
+            logger.info("Updating last_proactive_dm_at for user %s", user_id)
             self.engagement_service.update_last_proactive_dm(recipient)
             result["timestamp_updated"] = recipient.last_proactive_dm_at
-            logger.info(
-                f"Updated timestamp to {result['timestamp_updated']}"
-            )
+            logger.info("Updated timestamp to %s", result["timestamp_updated"])
 
-            # Step 5: Create successful task record
+            # Step 5: Create successful task record (commits the timestamp with it)
             task = self._create_task_record(user_id, TaskStatus.COMPLETED)
             result["task_id"] = task.id
 
             result["success"] = True
-            logger.info(f"Random DM workflow completed successfully for user {user_id}")
-            return result
-
-        except SlackApiError:
-            # Already logged and task record created above
-            return result
-
+            logger.info("Random DM workflow completed successfully for user %s", user_id)
         except Exception as e:
             logger.exception(f"Unexpected error in random DM workflow: {e}")
             result["error"] = str(e)
-            if result["user_selected"]:
-                # Create failed task record if we got far enough to select a user
-                task = self._create_task_record(
-                    result["user_selected"],
-                    TaskStatus.FAILED,
-                    error_message=str(e),
-                )
-                result["task_id"] = task.id
-            return result
+            result["timestamp_updated"] = None
+            # Discard the uncommitted timestamp update
+            self.db_session.rollback()
+            task = self._create_task_record(user_id, TaskStatus.FAILED, error_message=result["error"])
+            result["task_id"] = task.id
+
+        return result
+
+    async def send_batch(
+        self,
+        app: Any,
+        slack_client: AsyncWebClient,
+        count: int,
+        concurrency: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send proactive DMs to several distinct team members concurrently.
+
+        Recipients are selected up front so concurrent sends never pick the
+        same user; a semaphore caps the number of in-flight Slack calls.
+        Database writes happen sequentially once all sends have finished, so
+        one failed DM cannot roll back another's bookkeeping.
+
+        Args:
+            app: Slack App instance
+            slack_client: Slack AsyncWebClient instance
+            count: Maximum number of DMs to send
+            concurrency: Maximum number of DMs in flight at once
+
+        Returns:
+            List of result dicts (see send_random_dm), one per recipient
+        """
+        recipients = self.engagement_service.select_dm_recipients(count)
+        if not recipients:
+            logger.warning("No eligible users for random DM batch")
+            return []
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def deliver_one(recipient: TeamMember) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._deliver_dm(slack_client, recipient)
+
+        # Only the Slack calls run concurrently; the session is not safe to
+        # share between them, so the bookkeeping runs one DM at a time
+        deliveries = await asyncio.gather(*(deliver_one(r) for r in recipients))
+        results = [self._record_dm(r, d) for r, d in zip(recipients, deliveries, strict=True)]
+        sent = sum(1 for r in results if r["success"])
+        logger.info(f"Random DM batch completed: {sent}/{len(results)} sent")
+        return results
 
 
 # Module-level function for easy scheduler integration
 async def send_random_proactive_dm(
-    app: Mock,
+    app: Any,
     db_session: Session,
-    slack_client: Mock,
+    slack_client: AsyncWebClient,
     engagement_service: Optional[EngagementService] = None,
 ) -> Dict[str, Any]:
     """
@@ -264,7 +399,7 @@ async def send_random_proactive_dm(
     Args:
         app: Slack App instance
         db_session: Database session
-        slack_client: Slack WebClient instance
+        slack_client: Slack AsyncWebClient instance
         engagement_service: Optional EngagementService instance
 
     Returns:
@@ -274,3 +409,33 @@ async def send_random_proactive_dm(
         db_session=db_session, engagement_service=engagement_service
     )
     return await service.send_random_dm(app, slack_client)
+
+
+async def send_random_proactive_dms(
+    app: Any,
+    db_session: Session,
+    slack_client: AsyncWebClient,
+    count: int,
+    concurrency: int = 10,
+    engagement_service: Optional[EngagementService] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Send proactive DMs to up to count team members concurrently.
+
+    Batch counterpart of send_random_proactive_dm, e.g. for morning greetings.
+
+    Args:
+        app: Slack App instance
+        db_session: Database session
+        slack_client: Slack AsyncWebClient instance
+        count: Maximum number of DMs to send
+        concurrency: Maximum number of DMs in flight at once
+        engagement_service: Optional EngagementService instance
+
+    Returns:
+        List of result dicts (see ProactiveDMService.send_random_dm)
+    """
+    service = ProactiveDMService(
+        db_session=db_session, engagement_service=engagement_service
+    )
+    return await service.send_batch(app, slack_client, count, concurrency=concurrency)
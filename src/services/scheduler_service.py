@@ -4,14 +4,21 @@ APScheduler service for background task scheduling.
 Manages scheduled tasks like proactive DMs, image posting, and cleanup jobs.
 """
 
+import asyncio
 import os
+import threading
 from datetime import datetime
 from typing import Optional
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.util import utc_timestamp_to_datetime
+from sqlalchemy import select
 
+from src.utils.database import DATABASE_URL, engine
 from src.utils.logger import logger
 from src.utils.config_loader import config
 
@@ -19,18 +26,67 @@ from src.utils.config_loader import config
 # Global scheduler instance
 scheduler: Optional[BackgroundScheduler] = None
 
+# Persistent job store of the global scheduler (for direct job row reads)
+_jobstore: Optional[SQLAlchemyJobStore] = None
 
-def init_scheduler(db_path: Optional[str] = None) -> BackgroundScheduler:
+# Long-lived event loop (own daemon thread) that runs async job functions
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_thread: Optional[threading.Thread] = None
+_async_loop_lock = threading.Lock()
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop for async jobs, starting it on first use.
+
+    Reusing one loop avoids creating and tearing down a loop (and the HTTP
+    sessions bound to it) on every job run.
+
+    Returns:
+        Running event loop
+    """
+    global _async_loop, _async_thread
+
+    with _async_loop_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            _async_thread = threading.Thread(
+                target=_async_loop.run_forever,
+                name="scheduler-async-loop",
+                daemon=True,
+            )
+            _async_thread.start()
+        return _async_loop
+
+
+def _stop_async_loop() -> None:
+    """Stop and close the async job loop if it was started."""
+    global _async_loop, _async_thread
+
+    with _async_loop_lock:
+        if _async_loop is None:
+            return
+        loop, thread = _async_loop, _async_thread
+        _async_loop = _async_thread = None
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def init_scheduler(db_path: Optional[str] = None, paused: bool = False) -> BackgroundScheduler:
     """
     Initialize and configure APScheduler.
 
     Args:
         db_path: Optional database path (for testing). If not provided, uses DATABASE_URL env var.
+        paused: Start without processing jobs, so callers can register several
+            jobs before calling scheduler.resume() once
 
     Returns:
         Configured BackgroundScheduler instance
     """
-    global scheduler
+    global scheduler, _jobstore
 
     if scheduler is not None:
         logger.warning("Scheduler already initialized")
@@ -42,14 +98,26 @@ def init_scheduler(db_path: Optional[str] = None) -> BackgroundScheduler:
     else:
         database_url = os.getenv("DATABASE_URL", "sqlite:///data/lukas.db")
 
-    # Configure job stores
+    # Configure job stores; for the app database, share its engine (and its
+    # connection pool) instead of opening a second pool on the same file
+    if database_url == DATABASE_URL:
+        jobstore = SQLAlchemyJobStore(engine=engine, tablename="apscheduler_jobs")
+    else:
+        jobstore = SQLAlchemyJobStore(url=database_url, tablename="apscheduler_jobs")
     jobstores = {
-        "default": SQLAlchemyJobStore(url=database_url, tablename="apscheduler_jobs")
+        "default": jobstore,
+        # Recurring jobs re-registered at every startup need no persistence,
+        # so their runs skip the job store UPDATE (and may wrap closures)
+        "memory": MemoryJobStore(),
     }
+    _jobstore = jobstore
 
     # Configure executors
+    # Network-bound jobs (Slack/OpenAI calls) get their own larger pool so a
+    # slow request doesn't hold up other jobs; sized like concurrent.futures
     executors = {
-        "default": ThreadPoolExecutor(max_workers=5)
+        "default": ThreadPoolExecutor(max_workers=5),
+        "io": ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)),
     }
 
     # Job defaults
@@ -68,8 +136,8 @@ def init_scheduler(db_path: Optional[str] = None) -> BackgroundScheduler:
     )
 
     # Start scheduler
-    scheduler.start()
-    logger.info("APScheduler initialized and started")
+    scheduler.start(paused=paused)
+    logger.info(f"APScheduler initialized and started{' (paused)' if paused else ''}")
 
     return scheduler
 
@@ -113,6 +181,7 @@ def schedule_random_dm_task(interval_hours: int = 24, send_random_dm_func=None):
         "interval",
         hours=interval_hours,
         id="random_dm_task",
+        executor="io",
         replace_existing=True,
     )
 
@@ -151,14 +220,16 @@ def schedule_image_post_task(
 
     # Create wrapper function for async call
     def sync_wrapper():
-        import asyncio
-        asyncio.run(post_image_func(channel_id))
+        future = asyncio.run_coroutine_threadsafe(post_image_func(channel_id), _get_async_loop())
+        future.result()
 
     job = sched.add_job(
         sync_wrapper,
         "interval",
         days=interval_days,
         id="image_post_task",
+        jobstore="memory",
+        executor="io",
         replace_existing=True,
     )
 
@@ -189,18 +260,30 @@ def schedule_cleanup_task(cron_expression: str = "0 2 * * *") -> None:
     logger.info(f"Cleanup task will be scheduled (cron: {cron_expression})")
 
 
-def get_scheduled_task_info(job_id: str) -> Optional[dict]:
+def get_scheduled_task_info(job_id: str, include_trigger: bool = True) -> Optional[dict]:
     """
     Get information about a scheduled task.
 
     Args:
         job_id: The ID of the job to query
+        include_trigger: Include the trigger description. If False, only the
+            job row's id and next run time are read, without unpickling the job
+            (jobs in the memory store are looked up directly).
 
     Returns:
         Dict with job information or None if job doesn't exist
     """
     try:
         sched = get_scheduler()
+        if not include_trigger:
+            info = _get_job_row_info(sched, job_id)
+            if info is None:
+                # Jobs wrapping async functions live in the memory store, which
+                # has no table to read; looking them up there is cheap anyway
+                job = sched.get_job(job_id, jobstore="memory")
+                if job is not None:
+                    info = {"id": job.id, "next_run_time": job.next_run_time, "trigger": None}
+            return info
         job = sched.get_job(job_id)
         if job is None:
             return None
@@ -214,6 +297,35 @@ def get_scheduled_task_info(job_id: str) -> Optional[dict]:
         return None
 
 
+def _get_job_row_info(sched: BackgroundScheduler, job_id: str) -> Optional[dict]:
+    """
+    Read a job's id and next run time straight from the job store table.
+
+    Args:
+        sched: Running scheduler, whose timezone the run time is converted to
+        job_id: The ID of the job to query
+
+    Returns:
+        Dict with job information (trigger is None) or None if job doesn't exist
+    """
+    jobs_t = _jobstore.jobs_t
+    stmt = select(jobs_t.c.id, jobs_t.c.next_run_time).where(jobs_t.c.id == job_id)
+    with _jobstore.engine.connect() as connection:
+        row = connection.execute(stmt).first()
+    if row is None:
+        return None
+    # Stored as a UTC timestamp; paused jobs are stored without a next run time
+    next_run_time = utc_timestamp_to_datetime(row.next_run_time)
+    if next_run_time is not None:
+        # Match job.next_run_time, which is in the scheduler's timezone
+        next_run_time = next_run_time.astimezone(sched.timezone)
+    return {
+        "id": row.id,
+        "next_run_time": next_run_time,
+        "trigger": None,
+    }
+
+
 def remove_scheduled_task(job_id: str) -> bool:
     """
     Remove a scheduled task.
@@ -226,13 +338,13 @@ def remove_scheduled_task(job_id: str) -> bool:
     """
     try:
         sched = get_scheduler()
-        job = sched.get_job(job_id)
-        if job is None:
-            logger.warning(f"Job {job_id} does not exist")
-            return False
+        # remove_job raises if the job is missing, so no separate get_job lookup
         sched.remove_job(job_id)
         logger.info(f"Removed scheduled task: {job_id}")
         return True
+    except JobLookupError:
+        logger.warning(f"Job {job_id} does not exist")
+        return False
     except Exception as e:
         logger.error(f"Error removing job {job_id}: {e}")
         return False
@@ -240,8 +352,10 @@ def remove_scheduled_task(job_id: str) -> bool:
 
 def shutdown_scheduler() -> None:
     """Shutdown the scheduler gracefully."""
-    global scheduler
+    global scheduler, _jobstore
     if scheduler is not None:
         scheduler.shutdown(wait=True)
         logger.info("Scheduler shut down")
         scheduler = None
+        _jobstore = None
+    _stop_async_loop()
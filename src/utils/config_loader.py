@@ -7,7 +7,7 @@ Loads configuration from YAML file and environment variables.
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 from dotenv import load_dotenv
@@ -15,6 +15,18 @@ from dotenv import load_dotenv
 from src.utils.logger import logger
 
 
+def _load_dotenv() -> None:
+    """Load environment variables from .env file."""
+    env_file = Path(".env")
+    if env_file.exists():
+        load_dotenv(env_file)
+        logger.info("Loaded environment variables from .env file")
+
+
+# Env var reference: ${VAR_NAME} or ${VAR_NAME:-default}
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}:]+)(?::-([^}]+))?\}")
+
+
 class ConfigLoader:
     """
     Configuration loader that merges YAML config with environment variables.
@@ -32,17 +44,10 @@ class ConfigLoader:
         """
         self.config_file = config_file
         self.config: Dict[str, Any] = {}
-        self._load_dotenv()
+        self._lookup_cache: Dict[str, Any] = {}  # key_path -> value
         self._load_yaml()
         self._resolve_env_vars()
 
-    def _load_dotenv(self) -> None:
-        """Load environment variables from .env file."""
-        env_file = Path(".env")
-        if env_file.exists():
-            load_dotenv(env_file)
-            logger.info("Loaded environment variables from .env file")
-
     def _load_yaml(self) -> None:
         """Load configuration from YAML file."""
         config_path = Path(self.config_file)
@@ -74,24 +79,16 @@ class ConfigLoader:
         - ${VAR_NAME} - Replace with env var value
         - ${VAR_NAME:-default} - Use default if env var not set
         """
-        self.config = self._resolve_dict(self.config)
-
-    def _resolve_dict(self, d: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively resolve env vars in dictionary."""
-        result = {}
-        for key, value in d.items():
-            if isinstance(value, dict):
-                result[key] = self._resolve_dict(value)
-            elif isinstance(value, str):
-                result[key] = self._resolve_string(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    self._resolve_string(item) if isinstance(item, str) else item
-                    for item in value
-                ]
-            else:
-                result[key] = value
-        return result
+        # Walk the loaded tree with an explicit stack, replacing strings in place
+        stack = [self.config]
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, str):
+                    container[key] = self._resolve_string(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
 
     def _resolve_string(self, value: str) -> str:
         """
@@ -103,8 +100,9 @@ class ConfigLoader:
         Returns:
             String with env vars resolved
         """
-        # Pattern: ${VAR_NAME} or ${VAR_NAME:-default}
-        pattern = r"\$\{([^}:]+)(?::-([^}]+))?\}"
+        # Most values reference no env var; skip the regex scan for them
+        if "${" not in value:
+            return value
 
         def replacer(match):
             var_name = match.group(1)
@@ -119,7 +117,7 @@ class ConfigLoader:
                 logger.warning(f"Environment variable {var_name} not set and no default provided")
                 return match.group(0)  # Return original if not found
 
-        return re.sub(pattern, replacer, value)
+        return _ENV_VAR_PATTERN.sub(replacer, value)
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -136,6 +134,12 @@ class ConfigLoader:
             config.get("bot.llm.provider")  # Returns nested value
             config.get("bot.llm.model", "gpt-3.5-turbo")  # With default
         """
+        # Config is not modified after load, so resolved paths can be reused
+        try:
+            return self._lookup_cache[key_path]
+        except KeyError:
+            pass
+
         keys = key_path.split(".")
         value = self.config
 
@@ -145,6 +149,8 @@ class ConfigLoader:
             else:
                 return default
 
+        # Only found paths are cached; misses depend on the caller's default
+        self._lookup_cache[key_path] = value
         return value
 
     def get_all(self) -> Dict[str, Any]:
@@ -157,5 +163,33 @@ class ConfigLoader:
         return self.config
 
 
+class _LazyConfigLoader:
+    """
+    Global config proxy that loads the YAML config on first use.
+
+    Importing this module (which most modules do) then costs no YAML parsing
+    or env var resolution unless a config value is actually read.
+    """
+
+    def __init__(self):
+        self._loader: Optional[ConfigLoader] = None
+
+    def _get_loader(self) -> ConfigLoader:
+        if self._loader is None:
+            self._loader = ConfigLoader()
+        return self._loader
+
+    def get(self, key_path: str, default: Any = None) -> Any:
+        """See ConfigLoader.get."""
+        return self._get_loader().get(key_path, default)
+
+    def get_all(self) -> Dict[str, Any]:
+        """See ConfigLoader.get_all."""
+        return self._get_loader().get_all()
+
+
+# .env stays loaded at import time: modules read os.getenv() at import
+_load_dotenv()
+
 # Global config instance
-config = ConfigLoader()
+config = _LazyConfigLoader()
@@ -20,6 +20,9 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///data/lukas.db")
 
 # Create SQLAlchemy engine
 # For SQLite, enable foreign keys and WAL mode for better concurrency
+# The APScheduler job store shares this engine's pool, but SQLite still allows
+# only one writer: don't call the job store while a session has pending writes,
+# or its write waits out the busy timeout (sqlite3's 5s default) and fails.
 engine = create_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL query logging (useful for debugging)
@@ -29,22 +32,32 @@ engine = create_engine(
 
 
 # Enable SQLite optimizations
+@event.listens_for(Engine, "first_connect")
+def set_sqlite_journal_mode(dbapi_conn, connection_record):
+    """
+    Switch SQLite to Write-Ahead Logging for better concurrency.
+
+    journal_mode=WAL is stored in the database file, so it only needs to be
+    set on an engine's first connection; later connections inherit it.
+    """
+    if "sqlite" in DATABASE_URL:
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+        logger.debug("SQLite pragma set: journal_mode=WAL")
+
+
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
     """
-    Set SQLite pragmas for better performance.
+    Set per-connection SQLite pragmas for better performance.
 
     - foreign_keys: Enable foreign key constraints
-    - journal_mode: Use Write-Ahead Logging for better concurrency
     - synchronous: NORMAL provides good balance of safety and performance
     """
     if "sqlite" in DATABASE_URL:
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.execute("PRAGMA synchronous=NORMAL")
-        cursor.close()
-        logger.debug("SQLite pragmas set: foreign_keys=ON, journal_mode=WAL, synchronous=NORMAL")
+        # Both pragmas in one call; a new connection has no open transaction
+        dbapi_conn.executescript("PRAGMA foreign_keys=ON; PRAGMA synchronous=NORMAL;")
 
 
 # Session factory
@@ -2,20 +2,31 @@
 Retry utilities with exponential backoff.
 
 Provides decorators and utilities for retrying operations with tenacity.
+The decorator factories are cached, so every call site using the same
+arguments shares one decorator (each decorated function still gets its own
+Retrying state).
 """
 
+import logging
+from functools import cache
+from typing import Optional
+
+from requests.exceptions import ConnectionError, Timeout
+from slack_sdk.errors import SlackApiError
 from tenacity import (
+    before_sleep_log,
     retry,
+    retry_if_exception,
+    retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log,
 )
-import logging
+from tenacity.wait import wait_base
 
 from src.utils.logger import logger
 
 
+@cache
 def retry_on_api_error(max_attempts: int = 3, min_wait: int = 1, max_wait: int = 10):
     """
     Decorator for retrying API calls with exponential backoff.
@@ -42,6 +53,7 @@ def retry_on_api_error(max_attempts: int = 3, min_wait: int = 1, max_wait: int =
     )
 
 
+@cache
 def retry_on_connection_error(max_attempts: int = 3):
     """
     Decorator for retrying on connection errors.
@@ -58,8 +70,6 @@ def retry_on_connection_error(max_attempts: int = 3):
             # Connection code
             pass
     """
-    from requests.exceptions import ConnectionError, Timeout
-
     return retry(
         stop=stop_after_attempt(max_attempts),
         wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -67,3 +77,83 @@ def retry_on_connection_error(max_attempts: int = 3):
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )
+
+
+# Slack error codes that indicate a transient problem worth retrying;
+# anything else (user_not_found, invalid_auth, ...) will never succeed
+RETRYABLE_SLACK_ERRORS = frozenset({
+    "ratelimited",
+    "rate_limited",
+    "fatal_error",
+    "internal_error",
+    "service_unavailable",
+    "request_timeout",
+})
+
+
+def _is_retryable_slack_error(exc: BaseException) -> bool:
+    """Check whether an exception is a transient Slack API failure."""
+    if not isinstance(exc, SlackApiError):
+        return False
+    response = exc.response
+    status_code = getattr(response, "status_code", None)
+    if status_code == 429 or (status_code is not None and status_code >= 500):
+        return True
+    return response is not None and response.get("error") in RETRYABLE_SLACK_ERRORS
+
+
+def _get_retry_after(exc: BaseException) -> Optional[float]:
+    """Get the Retry-After delay (seconds) from a Slack API error, if present."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    for name, value in headers.items():
+        if name.lower() == "retry-after":
+            try:
+                return float(value[0] if isinstance(value, list) else value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+class wait_slack_retry_after(wait_base):
+    """Wait as long as Slack's Retry-After header asks, else fall back to another wait."""
+
+    def __init__(self, fallback: wait_base):
+        self.fallback = fallback
+
+    def __call__(self, retry_state) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = _get_retry_after(exc) if exc is not None else None
+        if retry_after is not None:
+            return retry_after
+        return self.fallback(retry_state)
+
+
+@cache
+def retry_on_slack_error(max_attempts: int = 3, min_wait: int = 2, max_wait: int = 10):
+    """
+    Decorator for retrying Slack API calls on transient failures only.
+
+    Rate limits honour Slack's Retry-After header; other retryable errors use
+    exponential backoff. Non-retryable errors are raised immediately.
+
+    Args:
+        max_attempts: Maximum number of retry attempts
+        min_wait: Minimum backoff wait time in seconds
+        max_wait: Maximum backoff wait time in seconds
+
+    Returns:
+        Tenacity retry decorator
+
+    Example:
+        @retry_on_slack_error()
+        async def post_message():
+            # Slack API call code
+            pass
+    """
+    return retry(
+        stop=stop_after_attempt(max_attempts),
+        wait=wait_slack_retry_after(wait_exponential(multiplier=1, min=min_wait, max=max_wait)),
+        retry=retry_if_exception(_is_retryable_slack_error),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
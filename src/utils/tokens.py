@@ -0,0 +1,35 @@
+"""
+Token budgeting helpers.
+
+Shared by the LLM services so both truncate conversation history the same way
+for the same settings.
+"""
+
+# OpenAI chat format overhead per message (role and delimiters)
+TOKENS_PER_MESSAGE = 4
+
+
+def history_token_budget(
+    max_tokens_per_request: int,
+    max_response_tokens: int,
+    max_history_messages: int,
+) -> int:
+    """
+    Compute the token budget for prompt message content.
+
+    The response is reserved out of max_tokens_per_request, along with the
+    per-message overhead for a full history window plus the new user message.
+
+    Args:
+        max_tokens_per_request: Maximum tokens per request (prompt and response)
+        max_response_tokens: Maximum tokens in response
+        max_history_messages: Most history messages a prompt can include
+
+    Returns:
+        Tokens available for message content
+    """
+    return (
+        max_tokens_per_request
+        - max_response_tokens
+        - TOKENS_PER_MESSAGE * (max_history_messages + 1)
+    )
@@ -4,21 +4,38 @@ Pytest configuration and fixtures for database testing.
 Provides shared test fixtures for database setup, cleanup, and test data seeding.
 """
 
+import json
 import os
 import tempfile
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
+from types import MappingProxyType
 from typing import Generator
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
 
-from src.models import Base, TeamMember, ConversationSession, Message, Configuration
+from src.models import Base, TeamMember, ConversationSession, Message, Configuration, utc_now
 from src.repositories.conversation_repo import ConversationRepository
 from src.repositories.team_member_repo import TeamMemberRepository
 from src.repositories.config_repo import ConfigurationRepository
+from src.services.engagement_service import EngagementService
+from src.services.proactive_dm_service import ProactiveDMService
+
+
+# Offsets used to seed last_proactive_dm_at values
+_ONE_HOUR = timedelta(hours=1)
+_TWO_DAYS = timedelta(days=2)
+_FIVE_DAYS = timedelta(days=5)
+_WEEK = timedelta(days=7)
+_THIRTY_DAYS = timedelta(days=30)
+
+# Serialized once; stored as the active_hours configuration value
+_ACTIVE_HOURS_JSON = json.dumps({"start_hour": 8, "end_hour": 18})
 
 
 @pytest.fixture(scope="function")
@@ -46,26 +63,41 @@ def test_db_path() -> Generator[Path, None, None]:
         db_path.unlink()
 
 
-@pytest.fixture(scope="function")
-def test_engine(test_db_path: Path) -> Generator[Engine, None, None]:
+@pytest.fixture(scope="session")
+def test_engine(tmp_path_factory: pytest.TempPathFactory) -> Generator[Engine, None, None]:
     """
-    Create a SQLAlchemy engine for the test database.
+    Create a SQLAlchemy engine for the shared test database.
 
     Configures SQLite with the same pragmas as production (foreign keys, WAL mode)
-    to ensure test behavior matches production. Creates all tables from models.
+    to ensure test behavior matches production. Tables are created once per test
+    run; each test's changes are rolled back by the test_session fixture.
+
+    Set TEST_DB=memory to use an in-memory database instead of a file.
 
     Args:
-        test_db_path: Path to test database file
+        tmp_path_factory: Pytest factory for session-scoped temporary directories
 
     Yields:
         Configured SQLAlchemy engine
     """
-    # Create engine with SQLite optimizations matching production
-    engine = create_engine(
-        f"sqlite:///{test_db_path}",
-        echo=False,  # Disable SQL logging in tests for cleaner output
-        connect_args={"check_same_thread": False},  # Allow multi-thread access
-    )
+    if os.getenv("TEST_DB", "file") == "memory":
+        # Opt-in in-memory database: no disk I/O, but no WAL either. StaticPool
+        # keeps one connection, since every new one would see an empty database.
+        engine = create_engine(
+            "sqlite://",
+            echo=False,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        db_path = tmp_path_factory.mktemp("db") / "test_lukas.db"
+
+        # Create engine with SQLite optimizations matching production
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            echo=False,  # Disable SQL logging in tests for cleaner output
+            connect_args={"check_same_thread": False},  # Allow multi-thread access
+        )
 
     # Enable SQLite pragmas for foreign key support and performance
     @event.listens_for(engine, "connect")
@@ -75,6 +107,12 @@ def test_engine(test_db_path: Path) -> Generator[Engine, None, None]:
         cursor.execute("PRAGMA journal_mode=WAL")
         cursor.execute("PRAGMA synchronous=NORMAL")
         cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     # Create all tables from models
     Base.metadata.create_all(engine)
@@ -90,9 +128,9 @@ def test_session(test_engine: Engine) -> Generator[Session, None, None]:
     """
     Create a database session for testing with automatic rollback.
 
-    Each test gets a fresh session that is rolled back after the test completes,
-    ensuring test isolation. This allows tests to modify the database without
-    affecting other tests.
+    The session is bound to a connection inside an outer transaction that is
+    rolled back after the test completes, ensuring test isolation. Commits and
+    rollbacks made by the test only release or roll back SAVEPOINTs.
 
     Args:
         test_engine: Test database engine
@@ -100,15 +138,20 @@ def test_session(test_engine: Engine) -> Generator[Session, None, None]:
     Yields:
         Database session for the test
     """
-    # Create session factory
-    SessionLocal = sessionmaker(bind=test_engine, expire_on_commit=False)
-    session = SessionLocal()
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     yield session
 
-    # Cleanup: Rollback any changes and close session
-    session.rollback()
+    # Cleanup: Discard everything the test wrote, committed or not
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -159,15 +202,12 @@ def seeded_db(test_session: Session) -> Session:
         is_bot=False,
         is_active=True,
         total_messages_sent=25,
-        last_proactive_dm_at=datetime.utcnow() - timedelta(days=2),
+        last_proactive_dm_at=utc_now() - _TWO_DAYS,
     )
 
-    test_session.add_all([admin, bot_user, regular_user])
-    test_session.flush()  # Get IDs without committing
-
-    # Seed conversations
+    # Seed conversations (linked via relationships, so no flush is needed for IDs)
     conv1 = ConversationSession(
-        team_member_id=admin.id,
+        team_member=admin,
         channel_type="dm",
         channel_id="C001",
         thread_ts=None,
@@ -177,7 +217,7 @@ def seeded_db(test_session: Session) -> Session:
     )
 
     conv2 = ConversationSession(
-        team_member_id=regular_user.id,
+        team_member=regular_user,
         channel_type="channel",
         channel_id="C002",
         thread_ts="1234567890.123456",
@@ -186,12 +226,9 @@ def seeded_db(test_session: Session) -> Session:
         is_active=True,
     )
 
-    test_session.add_all([conv1, conv2])
-    test_session.flush()
-
     # Seed messages
     msg1 = Message(
-        conversation_id=conv1.id,
+        conversation=conv1,
         sender_type="user",
         content="Hello Lukas!",
         slack_ts="1234567890.111111",
@@ -199,7 +236,7 @@ def seeded_db(test_session: Session) -> Session:
     )
 
     msg2 = Message(
-        conversation_id=conv1.id,
+        conversation=conv1,
         sender_type="bot",
         content="Hi there! How can I help?",
         slack_ts="1234567890.222222",
@@ -207,14 +244,13 @@ def seeded_db(test_session: Session) -> Session:
     )
 
     msg3 = Message(
-        conversation_id=conv2.id,
+        conversation=conv2,
         sender_type="user",
         content="Question about the project",
         slack_ts="1234567890.333333",
         token_count=8,
     )
 
-    test_session.add_all([msg1, msg2, msg3])
 
     # Seed default configurations
     configs = [
@@ -238,7 +274,8 @@ def seeded_db(test_session: Session) -> Session:
         ),
     ]
 
-    test_session.add_all(configs)
+    # One flush inserts everything, batching each table's rows into one statement
+    test_session.add_all([admin, bot_user, regular_user, conv1, conv2, msg1, msg2, msg3, *configs])
     test_session.commit()
 
     return test_session
@@ -279,8 +316,7 @@ def engagement_team_members(test_session: Session) -> list[TeamMember]:
     Returns:
         List of TeamMember instances committed to test database
     """
-    from unittest.mock import Mock
-
+    now = utc_now()
     members = [
         # Never contacted - highest priority for DM
         TeamMember(
@@ -301,7 +337,7 @@ def engagement_team_members(test_session: Session) -> list[TeamMember]:
             is_admin=False,
             is_bot=False,
             is_active=True,
-            last_proactive_dm_at=datetime.utcnow() - timedelta(days=7),
+            last_proactive_dm_at=now - _WEEK,
             total_messages_sent=10,
         ),
         # Contacted 2 days ago
@@ -312,7 +348,7 @@ def engagement_team_members(test_session: Session) -> list[TeamMember]:
             is_admin=False,
             is_bot=False,
             is_active=True,
-            last_proactive_dm_at=datetime.utcnow() - timedelta(days=2),
+            last_proactive_dm_at=now - _TWO_DAYS,
             total_messages_sent=20,
         ),
         # Contacted 1 hour ago - lowest priority
@@ -323,7 +359,7 @@ def engagement_team_members(test_session: Session) -> list[TeamMember]:
             is_admin=False,
             is_bot=False,
             is_active=True,
-            last_proactive_dm_at=datetime.utcnow() - timedelta(hours=1),
+            last_proactive_dm_at=now - _ONE_HOUR,
             total_messages_sent=30,
         ),
         # Admin user
@@ -334,7 +370,7 @@ def engagement_team_members(test_session: Session) -> list[TeamMember]:
             is_admin=True,
             is_bot=False,
             is_active=True,
-            last_proactive_dm_at=datetime.utcnow() - timedelta(days=5),
+            last_proactive_dm_at=now - _FIVE_DAYS,
             total_messages_sent=50,
         ),
         # Bot user - should be EXCLUDED
@@ -356,11 +392,13 @@ def engagement_team_members(test_session: Session) -> list[TeamMember]:
             is_admin=False,
             is_bot=False,
             is_active=False,
-            last_proactive_dm_at=datetime.utcnow() - timedelta(days=30),
+            last_proactive_dm_at=now - _THIRTY_DAYS,
             total_messages_sent=5,
         ),
     ]
 
+    # One flush inserts all rows as a single executemany; tests need the ORM
+    # instances back, so bulk_insert_mappings would not save anything here
     test_session.add_all(members)
     test_session.commit()
 
@@ -380,8 +418,6 @@ def engagement_config(test_session: Session) -> list[Configuration]:
     Returns:
         List of Configuration instances committed to test database
     """
-    import json
-
     configs = [
         Configuration(
             key="thread_response_probability",
@@ -397,7 +433,7 @@ def engagement_config(test_session: Session) -> list[Configuration]:
         ),
         Configuration(
             key="active_hours",
-            value=json.dumps({"start_hour": 8, "end_hour": 18}),
+            value=_ACTIVE_HOURS_JSON,
             value_type="json",
             description="Active hours for proactive engagement",
         ),
@@ -409,8 +445,45 @@ def engagement_config(test_session: Session) -> list[Configuration]:
     return configs
 
 
+def _reset_mock(mock, return_value):
+    """
+    Clear a shared mock's history and configuration for the next test.
+
+    Args:
+        mock: Mock or AsyncMock to reset
+        return_value: Return value to configure
+
+    Returns:
+        The reset mock
+    """
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.return_value = return_value
+    return mock
+
+
+@pytest.fixture(scope="session")
+def _slack_client_mocks() -> dict:
+    """
+    Build the Slack client method mocks once per test run.
+
+    Creating Mocks (and especially AsyncMocks) is comparatively slow, so the
+    method mocks are shared and reset by mock_slack_client and
+    mock_slack_client_for_dm instead of being rebuilt for every test.
+
+    Returns:
+        Dict mapping method names to mocks (async_* entries back the DM client)
+    """
+    return {
+        "conversations_replies": Mock(),
+        "reactions_add": Mock(),
+        "chat_postMessage": Mock(),
+        "async_conversations_open": AsyncMock(),
+        "async_chat_postMessage": AsyncMock(),
+    }
+
+
 @pytest.fixture(scope="function")
-def mock_slack_client():
+def mock_slack_client(_slack_client_mocks):
     """
     Provide mock Slack WebClient for testing.
 
@@ -419,15 +492,19 @@ def mock_slack_client():
     - reactions_add: Tracks reaction additions
     - chat_postMessage: Tracks sent messages
 
+    The client itself is new for every test, so attributes a test sets on it
+    do not leak; the method mocks are shared and reset here.
+
+    Args:
+        _slack_client_mocks: Session-wide Slack client method mocks
+
     Returns:
         Mock Slack client with configured methods
     """
-    from unittest.mock import Mock, AsyncMock
-
     client = Mock()
 
     # Mock conversations_replies for thread fetching
-    client.conversations_replies = Mock(return_value={
+    client.conversations_replies = _reset_mock(_slack_client_mocks["conversations_replies"], {
         "messages": [
             {"user": "U11111", "text": "Question", "ts": "1000.0"},
             {"user": "U22222", "text": "Answer", "ts": "1000.1"},
@@ -436,10 +513,10 @@ def mock_slack_client():
     })
 
     # Mock reactions_add for emoji reactions
-    client.reactions_add = Mock(return_value={"ok": True})
+    client.reactions_add = _reset_mock(_slack_client_mocks["reactions_add"], {"ok": True})
 
     # Mock chat_postMessage for sending messages
-    client.chat_postMessage = Mock(return_value={
+    client.chat_postMessage = _reset_mock(_slack_client_mocks["chat_postMessage"], {
         "ok": True,
         "ts": "1234567890.123456",
         "message": {"text": "Response"}
@@ -448,12 +525,21 @@ def mock_slack_client():
     return client
 
 
+def _event_decorator(event_type):
+    """Stand-in for App.event that registers nothing and returns the handler."""
+    def decorator(func):
+        return func
+    return decorator
+
+
 @pytest.fixture(scope="function")
 def mock_slack_app(mock_slack_client):
     """
     Provide mock Slack Bolt App for testing.
 
-    Includes mock client and event decorator registration.
+    Includes mock client and event decorator registration. The app is a fresh
+    Mock per test, so return values, side effects and attributes a test sets
+    on it cannot leak into other tests.
 
     Args:
         mock_slack_client: Mocked Slack client
@@ -461,18 +547,9 @@ def mock_slack_app(mock_slack_client):
     Returns:
         Mock Slack Bolt App
     """
-    from unittest.mock import Mock
-
     app = Mock()
     app.client = mock_slack_client
-
-    # Mock event decorator
-    def event_decorator(event_type):
-        def decorator(func):
-            return func
-        return decorator
-
-    app.event = event_decorator
+    app.event = _event_decorator
 
     return app
 
@@ -493,8 +570,6 @@ def engagement_service_instance(test_session: Session, team_member_repo, config_
     Returns:
         EngagementService instance with real dependencies
     """
-    from src.services.engagement_service import EngagementService
-
     return EngagementService(
         db_session=test_session,
         team_member_repo=team_member_repo,
@@ -502,7 +577,49 @@ def engagement_service_instance(test_session: Session, team_member_repo, config_
     )
 
 
-@pytest.fixture(scope="function")
+# Slack thread data is read-only, so it is built once and frozen
+_SAMPLE_THREAD_MESSAGES = MappingProxyType({
+    "messages": tuple(MappingProxyType(m) for m in [
+        {
+            "type": "message",
+            "user": "U_ALICE",
+            "text": "What do you all think about the new feature?",
+            "ts": "1234567890.000000",
+            "thread_ts": "1234567890.000000",
+        },
+        {
+            "type": "message",
+            "user": "U_BOB",
+            "text": "I think it's a great addition!",
+            "ts": "1234567890.100000",
+            "thread_ts": "1234567890.000000",
+        },
+        {
+            "type": "message",
+            "user": "U_CHARLIE",
+            "text": "Agreed, but we should test it more.",
+            "ts": "1234567890.200000",
+            "thread_ts": "1234567890.000000",
+        },
+        {
+            "type": "message",
+            "bot_id": "B_SOMEBOT",
+            "text": "Automated deployment notification",
+            "ts": "1234567890.300000",
+            "thread_ts": "1234567890.000000",
+        },
+        {
+            "type": "message",
+            "user": "U_DIANA",
+            "text": "When can we release?",
+            "ts": "1234567890.400000",
+            "thread_ts": "1234567890.000000",
+        },
+    ]),
+})
+
+
+@pytest.fixture(scope="session")
 def sample_thread_messages():
     """
     Provide realistic Slack thread conversation data.
@@ -513,68 +630,29 @@ def sample_thread_messages():
     - 1 bot message (to test filtering)
 
     Returns:
-        Dict with Slack thread messages structure
+        Read-only mapping with Slack thread messages structure
     """
-    return {
-        "messages": [
-            {
-                "type": "message",
-                "user": "U_ALICE",
-                "text": "What do you all think about the new feature?",
-                "ts": "1234567890.000000",
-                "thread_ts": "1234567890.000000",
-            },
-            {
-                "type": "message",
-                "user": "U_BOB",
-                "text": "I think it's a great addition!",
-                "ts": "1234567890.100000",
-                "thread_ts": "1234567890.000000",
-            },
-            {
-                "type": "message",
-                "user": "U_CHARLIE",
-                "text": "Agreed, but we should test it more.",
-                "ts": "1234567890.200000",
-                "thread_ts": "1234567890.000000",
-            },
-            {
-                "type": "message",
-                "bot_id": "B_SOMEBOT",
-                "text": "Automated deployment notification",
-                "ts": "1234567890.300000",
-                "thread_ts": "1234567890.000000",
-            },
-            {
-                "type": "message",
-                "user": "U_DIANA",
-                "text": "When can we release?",
-                "ts": "1234567890.400000",
-                "thread_ts": "1234567890.000000",
-            },
-        ]
-    }
+    return _SAMPLE_THREAD_MESSAGES
 
 
 @pytest.fixture(scope="function")
-def mock_slack_client_for_dm(mock_slack_client):
+def mock_slack_client_for_dm(mock_slack_client, _slack_client_mocks):
     """
     Extend mock Slack client with DM-specific mocking.
 
-    Adds mocks for:
+    Adds async mocks (the DM service uses AsyncWebClient) for:
     - conversations_open: Opens DM channel with user
-    - Ensures chat_postMessage is already mocked
+    - chat_postMessage: Sends the DM
 
     Args:
         mock_slack_client: Base mock Slack client
+        _slack_client_mocks: Session-wide Slack client method mocks
 
     Returns:
         Mock Slack client configured for DM testing
     """
-    from unittest.mock import Mock
-
     # Mock conversations_open for DM creation
-    mock_slack_client.conversations_open = Mock(return_value={
+    mock_slack_client.conversations_open = _reset_mock(_slack_client_mocks["async_conversations_open"], {
         "ok": True,
         "channel": {
             "id": "D12345TEST",
@@ -582,6 +660,12 @@ def mock_slack_client_for_dm(mock_slack_client):
         }
     })
 
+    # Mock chat_postMessage for sending the DM
+    mock_slack_client.chat_postMessage = _reset_mock(
+        _slack_client_mocks["async_chat_postMessage"],
+        mock_slack_client.chat_postMessage.return_value,
+    )
+
     return mock_slack_client
 
 
@@ -597,8 +681,6 @@ def proactive_dm_service(test_session: Session, engagement_service_instance):
     Returns:
         ProactiveDMService instance with real dependencies
     """
-    from src.services.proactive_dm_service import ProactiveDMService
-
     return ProactiveDMService(
         db_session=test_session,
         engagement_service=engagement_service_instance,
@@ -7,11 +7,13 @@ Provides utilities to manually trigger scheduled tasks without waiting for timer
 from datetime import datetime
 from typing import Dict, Any, Optional
 from unittest.mock import Mock
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from src.models.team_member import TeamMember
 from src.models.scheduled_task import ScheduledTask, TaskType, TaskStatus
 from src.services.engagement_service import EngagementService
+from src.services.proactive_dm_service import send_random_proactive_dm
 from src.repositories.team_member_repo import TeamMemberRepository
 
 
@@ -51,8 +53,6 @@ async def trigger_random_dm_immediately(
     Raises:
         Exception: If Slack API calls fail (unless specifically handled)
     """
-    from src.services.proactive_dm_service import send_random_proactive_dm
-
     result = await send_random_proactive_dm(
         app=app,
         db_session=db_session,
@@ -140,5 +140,7 @@ def reset_all_dm_timestamps(db_session: Session) -> None:
     Args:
         db_session: Database session
     """
-    db_session.query(TeamMember).update({"last_proactive_dm_at": None})
+    # One UPDATE, no SELECT: the default synchronize strategy evaluates the
+    # change in Python, keeping already-loaded members (e.g. from fixtures) in sync
+    db_session.execute(update(TeamMember).values(last_proactive_dm_at=None))
     db_session.commit()
@@ -5,6 +5,8 @@ Tests the complete random DM feature from user selection through message sending
 and database updates, without relying on real timing or Slack API calls.
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock
@@ -447,3 +449,208 @@ class TestRandomDMFailureScenarios:
         # Assert: Timestamp unchanged
         test_session.refresh(never_contacted)
         assert never_contacted.last_proactive_dm_at == original_timestamp
+
+
+@pytest.mark.asyncio
+class TestRandomDMBatch:
+    """Integration tests for sending several proactive DMs at once."""
+
+    async def test_batch_sends_to_distinct_users_in_priority_order(
+        self,
+        engagement_team_members,
+        test_session,
+        mock_slack_app,
+        mock_slack_client_for_dm,
+        engagement_service_instance,
+    ):
+        """
+        Protects against: Concurrent DMs picking the same user
+
+        Given: Database with 5 eligible users (1 never contacted)
+        When: A batch of 3 DMs is sent
+        Then: 3 different users are contacted, never-contacted user first
+        """
+        from src.services.proactive_dm_service import send_random_proactive_dms
+
+        # Act
+        results = await send_random_proactive_dms(
+            app=mock_slack_app,
+            db_session=test_session,
+            slack_client=mock_slack_client_for_dm,
+            count=3,
+            concurrency=2,
+            engagement_service=engagement_service_instance,
+        )
+
+        # Assert
+        assert len(results) == 3
+        assert all(r["success"] for r in results)
+        users = [r["user_selected"] for r in results]
+        assert len(set(users)) == 3
+        assert users[0] == "U_NEVER"
+        assert mock_slack_client_for_dm.chat_postMessage.call_count == 3
+
+    async def test_batch_is_capped_by_eligible_users(
+        self,
+        engagement_team_members,
+        test_session,
+        mock_slack_app,
+        mock_slack_client_for_dm,
+        engagement_service_instance,
+    ):
+        """
+        Protects against: Messaging bots/inactive users or repeating users to fill a batch
+
+        Given: Database with 5 eligible users
+        When: A batch larger than that is requested
+        Then: Each eligible user receives exactly one DM
+        """
+        from src.services.proactive_dm_service import send_random_proactive_dms
+
+        # Act
+        results = await send_random_proactive_dms(
+            app=mock_slack_app,
+            db_session=test_session,
+            slack_client=mock_slack_client_for_dm,
+            count=20,
+            engagement_service=engagement_service_instance,
+        )
+
+        # Assert
+        eligible = {u.slack_user_id for u in engagement_team_members if u.is_active and not u.is_bot}
+        assert {r["user_selected"] for r in results} == eligible
+        assert len(results) == len(eligible)
+
+    async def test_batch_failure_does_not_discard_other_recipients_writes(
+        self,
+        engagement_team_members,
+        test_session,
+        mock_slack_app,
+        mock_slack_client_for_dm,
+        engagement_service_instance,
+    ):
+        """
+        Protects against: One failed DM rolling back the bookkeeping of the others
+
+        Given: A batch of 3 DMs where one recipient's send raises a non-Slack error
+        When: The batch is sent concurrently
+        Then: The other recipients' timestamps and completed task records survive
+        And: The failing recipient gets a failed task record and keeps its timestamp
+        """
+        from src.services.proactive_dm_service import send_random_proactive_dms
+
+        failing_user = "U_WEEK_AGO"
+        old_timestamp = next(
+            u.last_proactive_dm_at for u in engagement_team_members if u.slack_user_id == failing_user
+        )
+        open_response = mock_slack_client_for_dm.conversations_open.return_value
+
+        async def open_dm(users):
+            # Yield so the sends interleave, then fail for one recipient
+            await asyncio.sleep(0)
+            if users == [failing_user]:
+                raise RuntimeError("connection reset")
+            return open_response
+
+        mock_slack_client_for_dm.conversations_open.side_effect = open_dm
+
+        # Act
+        results = await send_random_proactive_dms(
+            app=mock_slack_app,
+            db_session=test_session,
+            slack_client=mock_slack_client_for_dm,
+            count=3,
+            concurrency=3,
+            engagement_service=engagement_service_instance,
+        )
+
+        # Assert
+        by_user = {r["user_selected"]: r for r in results}
+        assert by_user[failing_user]["success"] is False
+        assert "connection reset" in by_user[failing_user]["error"]
+        succeeded = [u for u in by_user if u != failing_user]
+        assert len(succeeded) == 2 and all(by_user[u]["success"] for u in succeeded)
+
+        test_session.expire_all()
+        for user_id in succeeded:
+            member = test_session.query(TeamMember).filter_by(slack_user_id=user_id).one()
+            assert member.last_proactive_dm_at == by_user[user_id]["timestamp_updated"]
+            task = test_session.query(ScheduledTask).filter_by(target_id=user_id).one()
+            assert task.status == TaskStatus.COMPLETED.value
+
+        failed_member = test_session.query(TeamMember).filter_by(slack_user_id=failing_user).one()
+        assert failed_member.last_proactive_dm_at == old_timestamp
+        failed_task = test_session.query(ScheduledTask).filter_by(target_id=failing_user).one()
+        assert failed_task.status == TaskStatus.FAILED.value
+
+
+@pytest.mark.asyncio
+class TestDMChannelCache:
+    """Tests reuse of opened DM channels across proactive DMs."""
+
+    async def test_second_dm_to_same_user_skips_conversations_open(
+        self,
+        engagement_team_members,
+        test_session,
+        mock_slack_app,
+        mock_slack_client_for_dm,
+        engagement_service_instance,
+    ):
+        """
+        Protects against: Opening the same DM channel on every proactive DM
+
+        Given: A DM was already sent to a user
+        When: Another DM is sent to that user with the same client
+        Then: conversations_open is called only once
+        """
+        from src.services.proactive_dm_service import ProactiveDMService
+
+        service = ProactiveDMService(test_session, engagement_service=engagement_service_instance)
+        recipient = engagement_team_members[0]
+
+        # Act
+        first = await service.send_random_dm(mock_slack_app, mock_slack_client_for_dm, recipient=recipient)
+        second = await service.send_random_dm(mock_slack_app, mock_slack_client_for_dm, recipient=recipient)
+
+        # Assert
+        assert first["success"] is True and second["success"] is True
+        assert second["dm_channel_id"] == "D12345TEST"
+        mock_slack_client_for_dm.conversations_open.assert_called_once()
+        assert mock_slack_client_for_dm.chat_postMessage.call_count == 2
+
+    async def test_stale_cached_channel_is_reopened(
+        self,
+        engagement_team_members,
+        test_session,
+        mock_slack_app,
+        mock_slack_client_for_dm,
+        engagement_service_instance,
+    ):
+        """
+        Protects against: Failing forever on a DM channel that no longer exists
+
+        Given: A cached DM channel that Slack now reports as channel_not_found
+        When: Another DM is sent to that user
+        Then: The channel is reopened and the message is sent
+        """
+        from src.services.proactive_dm_service import ProactiveDMService
+
+        service = ProactiveDMService(test_session, engagement_service=engagement_service_instance)
+        recipient = engagement_team_members[0]
+        await service.send_random_dm(mock_slack_app, mock_slack_client_for_dm, recipient=recipient)
+
+        ok_response = mock_slack_client_for_dm.chat_postMessage.return_value
+        mock_slack_client_for_dm.chat_postMessage.side_effect = [
+            SlackApiError(
+                message="channel_not_found",
+                response={"ok": False, "error": "channel_not_found"},
+            ),
+            ok_response,
+        ]
+
+        # Act
+        result = await service.send_random_dm(mock_slack_app, mock_slack_client_for_dm, recipient=recipient)
+
+        # Assert
+        assert result["success"] is True
+        assert mock_slack_client_for_dm.conversations_open.call_count == 2
@@ -8,8 +8,14 @@ import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch
 import time
+from zoneinfo import ZoneInfo
 
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.models import Base, ScheduledTask, TeamMember
 from src.services import scheduler_service
+from src.services.command_service import CommandService
 
 
 # Reset scheduler state before each test
@@ -117,6 +123,40 @@ class TestJobScheduling:
             # Cleanup
             scheduler.shutdown(wait=False)
 
+    def test_schedule_image_post_task_uses_memory_jobstore(self, test_db_path):
+        """Image post task wraps an async function, so it is kept in memory."""
+        # Given initialized scheduler
+        with patch.dict('os.environ', {'DATABASE_URL': f'sqlite:///{test_db_path}'}):
+            scheduler_service.init_scheduler()
+
+            async def post_image(channel_id):
+                pass
+
+            # When scheduling the image post task
+            scheduler_service.schedule_image_post_task(
+                interval_days=7,
+                channel_id="C12345678",
+                post_image_func=post_image
+            )
+
+            # Then job should be scheduled in the memory job store
+            scheduler = scheduler_service.get_scheduler()
+            assert scheduler.get_job('image_post_task', jobstore='memory') is not None
+            assert scheduler.get_job('image_post_task', jobstore='default') is None
+
+            # And job info without trigger should still find it
+            full_info = scheduler_service.get_scheduled_task_info('image_post_task')
+            row_info = scheduler_service.get_scheduled_task_info(
+                'image_post_task', include_trigger=False
+            )
+            assert row_info is not None
+            assert row_info['id'] == 'image_post_task'
+            assert row_info['next_run_time'] == full_info['next_run_time']
+            assert row_info['trigger'] is None
+
+            # Cleanup
+            scheduler.shutdown(wait=False)
+
     def test_schedule_random_dm_task_replaces_existing(self, test_db_path):
         """Scheduling same task twice should replace existing job."""
         # Given scheduler with existing random DM task
@@ -209,3 +249,92 @@ class TestSchedulerPersistence:
 
             # Cleanup
             scheduler.shutdown(wait=False)
+
+    def test_job_info_without_trigger_reads_job_row(self, test_db_path):
+        """Job info without trigger should match the full lookup's run time."""
+        # Given a scheduled job
+        with patch.dict('os.environ', {'DATABASE_URL': f'sqlite:///{test_db_path}'}):
+            scheduler = scheduler_service.init_scheduler()
+            scheduler_service.schedule_random_dm_task(
+                interval_hours=24,
+                send_random_dm_func=Mock()
+            )
+
+            # When reading info with and without the trigger
+            full_info = scheduler_service.get_scheduled_task_info('random_dm_task')
+            row_info = scheduler_service.get_scheduled_task_info(
+                'random_dm_task', include_trigger=False
+            )
+
+            # Then both should report the same job and next run time
+            assert row_info['id'] == full_info['id']
+            assert row_info['next_run_time'] == full_info['next_run_time']
+            assert row_info['trigger'] is None
+            assert scheduler_service.get_scheduled_task_info(
+                'nonexistent_task', include_trigger=False
+            ) is None
+
+            # Cleanup
+            scheduler.shutdown(wait=False)
+
+    def test_job_info_without_trigger_uses_scheduler_timezone(self, test_db_path):
+        """Job info without trigger should report the run time in the scheduler's timezone."""
+        # Given a scheduler running in a non-UTC timezone with a scheduled job
+        with patch.dict('os.environ', {'DATABASE_URL': f'sqlite:///{test_db_path}'}):
+            scheduler = scheduler_service.init_scheduler()
+            scheduler.timezone = ZoneInfo("Europe/Berlin")
+            scheduler_service.schedule_random_dm_task(
+                interval_hours=24,
+                send_random_dm_func=Mock()
+            )
+
+            # When reading info with and without the trigger
+            full_info = scheduler_service.get_scheduled_task_info('random_dm_task')
+            row_info = scheduler_service.get_scheduled_task_info(
+                'random_dm_task', include_trigger=False
+            )
+
+            # Then both should report the same zoned run time
+            assert row_info['next_run_time'].tzinfo == scheduler.timezone
+            assert row_info['next_run_time'] == full_info['next_run_time']
+            assert row_info['next_run_time'].utcoffset() == full_info['next_run_time'].utcoffset()
+
+            # Cleanup
+            scheduler.shutdown(wait=False)
+
+
+class TestReminderScheduling:
+    """Test reminders against a real job store sharing the app's database file."""
+
+    @pytest.mark.asyncio
+    async def test_create_reminder_with_database_jobstore(self, test_db_path):
+        """Reminder record and job should both persist without waiting on the file lock."""
+        # Given the app tables and the job store in the same SQLite file
+        engine = create_engine(f'sqlite:///{test_db_path}', connect_args={'timeout': 5})
+        Base.metadata.create_all(engine)
+        session = Session(engine)
+        user = TeamMember(slack_user_id='U_REMIND', display_name='Reminder User')
+        session.add(user)
+        session.commit()
+        scheduler = scheduler_service.init_scheduler(db_path=str(test_db_path))
+        service = CommandService(session, Mock())
+
+        # When creating a reminder
+        started = time.monotonic()
+        with patch('src.services.command_service.scheduler', scheduler):
+            result = await service.create_reminder(
+                task='check the build', when='30 minutes', user_id='U_REMIND'
+            )
+        elapsed = time.monotonic() - started
+
+        # Then it should succeed promptly, with the record and its job stored
+        assert result['success'] is True, result.get('error')
+        assert elapsed < 2
+        task = session.query(ScheduledTask).filter_by(target_id='U_REMIND').one()
+        assert task.status == 'pending'
+        assert scheduler.get_job(task.job_id) is not None
+
+        # Cleanup
+        scheduler.shutdown(wait=False)
+        session.close()
+        engine.dispose()
@@ -167,6 +167,29 @@ class TestCreateReminder:
             assert "3pm" in result["when_description"]
             mock_scheduler.add_job.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_reminder_marks_task_failed_when_job_not_stored(self, command_service, mock_regular_user, mock_db_session):
+        """Test a committed reminder record is marked failed if its job can't be stored."""
+        # Setup
+        command_service.team_member_repo.get_by_slack_id = Mock(return_value=mock_regular_user)
+
+        with patch('src.services.command_service.scheduler') as mock_scheduler:
+            mock_scheduler.add_job.side_effect = RuntimeError("job store unavailable")
+
+            # Execute
+            result = await command_service.create_reminder(
+                task="check the build",
+                when="30 minutes",
+                user_id="U_USER"
+            )
+
+        # Assert
+        assert result["success"] is False
+        task_record = mock_db_session.add.call_args[0][0]
+        assert task_record.status == "failed"
+        assert "job store unavailable" in task_record.error_message
+        assert mock_db_session.commit.call_count == 2
+
     @pytest.mark.asyncio
     async def test_create_reminder_invalid_format(self, command_service, mock_regular_user):
         """Test creating a reminder with invalid time format."""
@@ -373,3 +396,15 @@ class TestHelperMethods:
         assert command_service._parse_days_from_string("14 day") == 14
         assert command_service._parse_days_from_string("30") == 30
         assert command_service._parse_days_from_string("invalid") is None
+
+    def test_parse_time_to_datetime(self, command_service):
+        """Test time-of-day parsing for 12h and 24h formats."""
+        assert command_service._parse_time_to_datetime("3pm").hour == 15
+        assert command_service._parse_time_to_datetime("12am").hour == 0
+        parsed = command_service._parse_time_to_datetime("2:30pm")
+        assert (parsed.hour, parsed.minute) == (14, 30)
+        parsed = command_service._parse_time_to_datetime("14:30")
+        assert (parsed.hour, parsed.minute) == (14, 30)
+        assert command_service._parse_time_to_datetime("13pm") is None
+        assert command_service._parse_time_to_datetime("24:00") is None
+        assert command_service._parse_time_to_datetime("noon") is None
@@ -10,13 +10,16 @@ Following constitution: High-value tests covering critical paths,
 not exhaustive coverage of trivial code.
 """
 
+import asyncio
 import os
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
 import pytest
-import asyncio
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from pybreaker import CircuitBreaker
 
-from src.services.llm_agent_service import LLMAgentService
 from src.models.message import Message
+from src.services.llm_agent_service import LLMAgentService, _MessageSnapshot
 
 
 class TestLLMAgentServiceFallback:
@@ -128,6 +131,54 @@ class TestLLMAgentServiceFallback:
         assert call_count["calls"] == 2  # Called twice: agent then fallback
 
 
+    @pytest.mark.asyncio
+    async def test_generate_response_skips_agent_when_circuit_open(self):
+        """
+        An open MCP circuit sends the request straight to the no-tools path.
+
+        Protects: Known-down tools don't cost a full agent attempt with retries.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService()
+            service.agent = Mock()
+
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=60)
+        breaker.open()
+        service._breakers["web-search"] = breaker
+
+        service._call_agent = AsyncMock(return_value="Direct response")
+
+        response = await service.generate_response([], "Hello")
+
+        assert response == "Direct response"
+        service._call_agent.assert_called_once()
+        assert service._call_agent.call_args.kwargs["use_tools"] is False
+
+    @pytest.mark.asyncio
+    async def test_generate_response_retries_agent_after_reset_timeout(self):
+        """
+        Once the reset timeout passes, the agent runs again despite the open circuit.
+
+        Protects: The half-open trial call can happen, so tools recover.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService()
+            service.agent = Mock()
+
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=60, listeners=[service._breaker_listener])
+        breaker.open()
+        service._breakers["web-search"] = breaker
+        assert service._tools_available() is False
+
+        service._breaker_listener.opened_at[breaker] -= timedelta(seconds=61)
+        service._call_agent = AsyncMock(return_value="Agent response")
+
+        response = await service.generate_response([], "Hello")
+
+        assert response == "Agent response"
+        assert service._call_agent.call_args.kwargs["use_tools"] is True
+
+
 class TestLLMAgentServiceInitialization:
     """
     Test MCP initialization and connection lifecycle.
@@ -171,8 +222,8 @@ class TestLLMAgentServiceInitialization:
             service = LLMAgentService()
 
             # Mock the lifecycle task to succeed immediately
-            async def mock_lifecycle(url):
-                service._mcp_ready.set()
+            async def mock_lifecycle(url, server_name, ready_event):
+                ready_event.set()
 
             service._mcp_connection_lifecycle = AsyncMock(side_effect=mock_lifecycle)
 
@@ -190,23 +241,31 @@ class TestLLMAgentServiceInitialization:
         Protects: Graceful bot shutdown without hanging tasks.
         Scenario: Bot restart or shutdown.
         """
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+        with patch.dict(
+            os.environ,
+            {
+                "OPENAI_API_KEY": "test-key",
+                "MCP_WEB_SEARCH_URL": "http://test:8080/sse",
+                "MCP_SLACK_OPS_URL": "http://test:9766/sse",
+            },
+        ):
             service = LLMAgentService()
 
-            # Create mock background tasks (multi-server architecture)
-            async def mock_task():
-                await asyncio.sleep(100)  # Long-running
+            # Long-running lifecycle tasks (multi-server architecture)
+            async def mock_lifecycle(url, server_name, ready_event):
+                ready_event.set()
+                await asyncio.sleep(100)
 
-            service._mcp_tasks = [
-                asyncio.create_task(mock_task()),
-                asyncio.create_task(mock_task())
-            ]
+            service._mcp_connection_lifecycle = mock_lifecycle
+            await service.initialize_mcp()
+            assert len(service._mcp_tasks) == 2
 
             # Cleanup should cancel all tasks
             await service.cleanup()
 
             # All tasks should be cancelled or done
             assert all(task.cancelled() or task.done() for task in service._mcp_tasks)
+            assert service._mcp_supervisor.done()
 
 
 class TestTokenEstimation:
@@ -253,3 +312,315 @@ class TestTokenEstimation:
         assert tokens > 0
         # Should be less than character count (all tokenizers do this)
         assert tokens <= len(text)
+
+
+class TestPromptOrdering:
+    """
+    Test message ordering sent to the agent.
+
+    Included because the stable prefix is what makes OpenAI prompt caching hit.
+    """
+
+    @pytest.mark.asyncio
+    async def test_user_context_placed_after_history(self):
+        """
+        Per-user context is injected right before the user turn, not at the front.
+
+        Protects: Shared prefix (persona + history) stays identical across users.
+        """
+        from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService()
+
+        final = Mock(content="Hi!")
+        service.agent = Mock()
+        service.agent.ainvoke = AsyncMock(return_value={"messages": [final]})
+
+        history = [HumanMessage(content="Earlier"), AIMessage(content="Reply")]
+        await service._call_agent(
+            "Hello",
+            history,
+            use_tools=True,
+            user_context={"user_id": "U123", "user_name": "Alice"},
+        )
+
+        sent = service.agent.ainvoke.call_args[0][0]["messages"]
+        assert sent[:2] == history
+        assert isinstance(sent[-2], SystemMessage)
+        assert "U123" in sent[-2].content
+        assert isinstance(sent[-1], HumanMessage)
+        # Caller's history list is not mutated
+        assert len(history) == 2
+
+
+class TestConversationSummary:
+    """
+    Test rolling summaries of history evicted from the sliding window.
+
+    Included because summaries replace dropped turns and must stay incremental.
+    """
+
+    @staticmethod
+    def _messages(count):
+        return [
+            Message(
+                id=f"m{i}",
+                conversation_id="conv-1",
+                sender_type="user" if i % 2 == 0 else "bot",
+                content=f"message {i}",
+            )
+            for i in range(count)
+        ]
+
+    @classmethod
+    def _snapshots(cls, count):
+        return [
+            _MessageSnapshot(msg.id, msg.sender_type, msg.content)
+            for msg in cls._messages(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_only_newly_evicted_messages_are_summarized(self):
+        """
+        Each turn summarizes only the delta evicted since the previous summary.
+
+        Protects: Summary cost stays proportional to new messages, not history.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService(max_context_messages=2)
+
+        service.summary_llm = Mock()
+        service.summary_llm.ainvoke = AsyncMock(return_value=Mock(content="Summary"))
+
+        # 6 messages, window of 4 -> m0, m1 evicted
+        summary = await service._update_conversation_summary("conv-1", self._snapshots(6))
+        assert summary == "Summary"
+        prompt = service.summary_llm.ainvoke.call_args[0][0][0].content
+        assert "message 0" in prompt and "message 1" in prompt
+
+        # Two more messages -> only m2, m3 are new evictions
+        await service._update_conversation_summary("conv-1", self._snapshots(8))
+        prompt = service.summary_llm.ainvoke.call_args[0][0][0].content
+        assert "message 1" not in prompt
+        assert "message 2" in prompt and "message 3" in prompt
+
+        context = service._build_conversation_context(self._messages(8), "Summary")
+        assert context[0].content == "Conversation summary so far: Summary"
+        assert len(context) == 5
+
+    @pytest.mark.asyncio
+    async def test_no_summary_without_conversation_id(self):
+        """
+        Without a conversation ID the plain sliding window is used.
+
+        Protects: Proactive thread responses (no conversation) skip summarization.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService(max_context_messages=1)
+
+        service.summary_llm = Mock()
+        service.summary_llm.ainvoke = AsyncMock()
+
+        assert await service._update_conversation_summary(None, self._snapshots(6)) is None
+        service.summary_llm.ainvoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_summary_cache_is_bounded(self):
+        """
+        Only the most recently used conversations keep a summary in memory.
+
+        Protects: A long-running bot doesn't accumulate summaries forever.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService(max_context_messages=2)
+
+        service.summary_llm = Mock()
+        service.summary_llm.ainvoke = AsyncMock(return_value=Mock(content="Summary"))
+
+        with patch("src.services.llm_agent_service._MAX_CACHED_SUMMARIES", 2):
+            for conversation_id in ("conv-1", "conv-2", "conv-3"):
+                await service._update_conversation_summary(conversation_id, self._snapshots(6))
+
+        assert list(service._conversation_summaries) == ["conv-2", "conv-3"]
+        assert service._get_cached_summary("conv-1") is None
+
+    @pytest.mark.asyncio
+    async def test_summary_update_does_not_delay_reply(self):
+        """
+        The reply uses the previous summary while the new one is built in the background.
+
+        Protects: Evicting messages doesn't add a summary LLM call to response latency.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService(max_context_messages=2)
+
+        release = asyncio.Event()
+
+        async def slow_summary(messages):
+            await release.wait()
+            return Mock(content="Summary")
+
+        service.summary_llm = Mock()
+        service.summary_llm.ainvoke = AsyncMock(side_effect=slow_summary)
+        service._call_agent = AsyncMock(return_value="Reply")
+
+        # The reply returns while the summary call is still blocked
+        response = await asyncio.wait_for(
+            service.generate_response(self._messages(6), "Hello", conversation_id="conv-1"),
+            timeout=1,
+        )
+        assert response == "Reply"
+        assert service._get_cached_summary("conv-1") is None
+
+        # Once the background update finishes, the summary is available
+        release.set()
+        await service._summary_tasks["conv-1"]
+        assert service._get_cached_summary("conv-1") == "Summary"
+
+
+class TestContextTokenBudget:
+    """
+    Test token-budgeted conversation context.
+
+    Included because oversized requests cost more and can be rejected by the API.
+    """
+
+    def test_context_stops_at_token_budget(self):
+        """
+        Long messages are dropped oldest-first once the token budget is hit.
+
+        Protects: Input tokens stay under max_tokens_per_request.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            # 200 - 50 response - 4 * 21 overhead = 66 content tokens
+            service = LLMAgentService(
+                max_context_messages=10, max_tokens_per_request=200, max_response_tokens=50
+            )
+
+        service.estimate_tokens = lambda text: len(text)
+        messages = [
+            Message(sender_type="user", content="x" * 60),
+            Message(sender_type="bot", content="y" * 30),
+            Message(sender_type="user", content="z" * 30),
+        ]
+
+        context = service._build_conversation_context(messages)
+
+        assert [m.content for m in context] == ["y" * 30, "z" * 30]
+
+    def test_context_uses_stored_token_counts(self):
+        """
+        Messages with a persisted token_count are not re-estimated.
+
+        Protects: Token counting happens once, when the message is stored.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService(
+                max_context_messages=10, max_tokens_per_request=200, max_response_tokens=50
+            )
+
+        service.estimate_tokens = Mock(side_effect=lambda text: len(text))
+        messages = [
+            Message(sender_type="user", content="x" * 60, token_count=15),
+            Message(sender_type="bot", content="y" * 30, token_count=8),
+            Message(sender_type="user", content="z" * 30),
+        ]
+
+        context = service._build_conversation_context(messages)
+
+        assert [m.content for m in context] == ["x" * 60, "y" * 30, "z" * 30]
+        service.estimate_tokens.assert_called_once_with("z" * 30)
+
+    @pytest.mark.parametrize(
+        "max_response_tokens, expected",
+        [
+            (28, ["y" * 30, "z" * 30]),  # 100 - 28 - 4 * 3 = 60: both fit exactly
+            (29, ["z" * 30]),  # One token less: the older message is dropped
+        ],
+    )
+    def test_context_reserves_response_tokens(self, max_response_tokens, expected):
+        """
+        The response is reserved out of the budget, so history fills only the rest.
+
+        Protects: Prompt plus response stays within max_tokens_per_request.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService(
+                max_context_messages=1,
+                max_tokens_per_request=100,
+                max_response_tokens=max_response_tokens,
+            )
+
+        service.estimate_tokens = lambda text: len(text)
+        messages = [
+            Message(sender_type="bot", content="y" * 30),
+            Message(sender_type="user", content="z" * 30),
+        ]
+
+        context = service._build_conversation_context(messages)
+
+        assert [m.content for m in context] == expected
+
+
+class TestToolResultExtraction:
+    """
+    Test text extraction from MCP tool results.
+
+    Included because every tool call funnels through this conversion.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            (Mock(spec=["text"], text="single"), "single"),
+            ([Mock(spec=["text"], text="a"), "raw"], "a\nraw"),
+        ],
+    )
+    async def test_tool_result_text_extraction(self, content, expected):
+        """
+        Single text blocks and content lists are both converted to text.
+
+        Protects: Agent receives readable tool output for all result shapes.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService()
+
+        mcp_tool = Mock(inputSchema=None, description="Test tool")
+        mcp_tool.name = "test_tool"
+        session = Mock()
+        session.call_tool = AsyncMock(return_value=Mock(content=content))
+        service.mcp_sessions["test-server"] = session
+        service._server_semaphores["test-server"] = asyncio.Semaphore(1)
+        service._breakers["test-server"] = CircuitBreaker(fail_max=5, reset_timeout=60)
+
+        tool = service._create_langchain_tool(mcp_tool, "test-server")
+
+        assert await tool.coroutine() == expected
+
+    @pytest.mark.asyncio
+    async def test_tool_call_fails_fast_when_circuit_open(self):
+        """
+        Once a server's breaker trips, tool calls return without hitting the server.
+
+        Protects: A flaky MCP server can't stall every agent turn.
+        """
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            service = LLMAgentService()
+
+        mcp_tool = Mock(inputSchema=None, description="Test tool")
+        mcp_tool.name = "test_tool"
+        session = Mock()
+        session.call_tool = AsyncMock(side_effect=RuntimeError("server down"))
+        service.mcp_sessions["test-server"] = session
+        service._server_semaphores["test-server"] = asyncio.Semaphore(1)
+        service._breakers["test-server"] = CircuitBreaker(fail_max=2, reset_timeout=60)
+
+        tool = service._create_langchain_tool(mcp_tool, "test-server")
+        for _ in range(2):
+            await tool.coroutine()
+        result = await tool.coroutine()
+
+        assert "temporarily unavailable" in result
+        assert session.call_tool.call_count == 2
@@ -49,6 +49,9 @@ class TestDatabaseConnection:
         foreign_keys_enabled = result.scalar()
         assert foreign_keys_enabled == 1, "Foreign keys should be enabled in SQLite"
 
+    @pytest.mark.skipif(
+        os.getenv("TEST_DB") == "memory", reason="In-memory SQLite has no WAL journal"
+    )
     def test_sqlite_wal_mode_enabled(self, test_session: Session):
         """
         Test that SQLite Write-Ahead Logging (WAL) mode is enabled.
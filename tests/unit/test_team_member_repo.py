@@ -7,9 +7,12 @@ and eligibility filtering for proactive DMs.
 
 from datetime import datetime, timedelta
 
+import pytest
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.models import TeamMember
+from src.models import Message, TeamMember
+from src.repositories.conversation_repo import ConversationRepository
 from src.repositories.team_member_repo import TeamMemberRepository
 
 
@@ -201,6 +204,46 @@ class TestTeamMemberUpdates:
         seeded_db.refresh(admin)
         assert admin.total_messages_sent == original_count + 5
 
+    def test_increment_message_count_commits_with_bot_message(self, seeded_db: Session, team_member_repo: TeamMemberRepository):
+        """
+        Test a deferred increment is persisted by the bot message's commit.
+
+        Protects against: Message count and stored reply drifting apart.
+        """
+        admin = seeded_db.query(TeamMember).filter_by(slack_user_id="U001_ADMIN").first()
+        original_count = admin.total_messages_sent
+        conv_repo = ConversationRepository(seeded_db)
+        conversation = conv_repo.get_or_create_conversation(admin.id, "dm", "D_TXN")
+
+        team_member_repo.increment_message_count(admin.id, commit=False)
+        message = conv_repo.add_message(conversation.id, "bot", "Hi there!")
+
+        # Discarding pending changes must not undo what add_message committed
+        seeded_db.rollback()
+        seeded_db.refresh(admin)
+        assert admin.total_messages_sent == original_count + 1
+        assert seeded_db.query(Message).filter_by(id=message.id).count() == 1
+
+    def test_increment_message_count_rolls_back_with_bot_message(self, seeded_db: Session, team_member_repo: TeamMemberRepository):
+        """
+        Test a deferred increment is discarded when storing the bot message fails.
+
+        Protects against: Counting replies that were never persisted.
+        """
+        admin = seeded_db.query(TeamMember).filter_by(slack_user_id="U001_ADMIN").first()
+        original_count = admin.total_messages_sent
+        conv_repo = ConversationRepository(seeded_db)
+        conversation = conv_repo.get_or_create_conversation(admin.id, "dm", "D_TXN")
+
+        team_member_repo.increment_message_count(admin.id, commit=False)
+        with pytest.raises(IntegrityError):
+            conv_repo.add_message(conversation.id, "bot", None)
+        seeded_db.rollback()
+
+        seeded_db.refresh(admin)
+        assert admin.total_messages_sent == original_count
+        assert seeded_db.query(Message).filter_by(conversation_id=conversation.id).count() == 0
+
 
 class TestTeamMemberFiltering:
     """Test team member filtering and eligibility queries."""